@@ -3,44 +3,161 @@ Analyzer module for Markdown Inspector.
 Handles analyzing markdown files based on configuration requirements.
 """
 
-from typing import Dict, List, Tuple, Any
+import codecs
+from typing import Dict, List, Tuple, Any, Union
 from markdown_inspector.features.header_validation.core.config_loader import (
     ConfigLoader,
 )
-from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+from markdown_inspector.features.header_validation.core.plugin import (
+    HeaderValidationRule,
+)
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+    is_ascii_compatible,
+    prepare_content,
+)
+from markdown_inspector.features.rule_engine.core.engine import RuleEngine
+from markdown_inspector.features.rule_engine.core.plugin import make_finding
+from markdown_inspector.features.rule_engine.core.tokenizer import (
+    HEADING,
+    MarkdownTokenizer,
+)
+
+# Rule name of findings for files that cannot be read or decoded
+IO_RULE = "io"
 
 
 class MarkdownAnalyzer:
     """Analyzes markdown files against configuration requirements."""
 
-    def __init__(self, config_path: str):
+    def __init__(
+        self,
+        config_path: str,
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ):
         """
         Initialize the analyzer with a configuration file.
 
         Args:
             config_path: Path to the JSON configuration file
+            encoding: Encoding of markdown files without a byte order mark
+            errors: Error handler for undecodable bytes, as in bytes.decode
+
+        Raises:
+            LookupError: If the encoding is unknown
         """
+        codecs.lookup(encoding)
+        codecs.lookup_error(errors)
+        self.encoding = encoding
+        self.errors = errors
         self.config = ConfigLoader.load_config(config_path)
-        self.header_validator = HeaderValidator(self.config)
+        self.engine = RuleEngine(self.config)
+        header_rule = self.engine.get_plugin(HeaderValidationRule.name)
+        self.header_validator = header_rule.validator
+        self.header_tokenizer = MarkdownTokenizer([HEADING])
 
-    def analyze_file(self, markdown_path: str) -> Tuple[bool, List[str]]:
+    def read_content(self, markdown_path: str) -> Tuple[Union[str, bytes], str]:
         """
-        Analyze a markdown file against the configuration requirements.
+        Read a markdown file for tokenizing.
+
+        The file is read as bytes. Files in an ASCII-compatible encoding stay
+        bytes so that only the text the rules look at gets decoded; a byte
+        order mark overrides the configured encoding.
 
         Args:
             markdown_path: Path to the markdown file
 
         Returns:
-            Tuple of (success_flag, list_of_validation_messages)
+            Tuple of (content, encoding) as returned by prepare_content
+
+        Raises:
+            FileNotFoundError: If the markdown file doesn't exist
+            UnicodeDecodeError: If a file that must be decoded in full cannot
+                be decoded with the "strict" error handler
+        """
+        with open(markdown_path, "rb") as md_file:
+            data = md_file.read()
+        return prepare_content(data, self.encoding, self.errors)
+
+    def read_headers(self, markdown_path: str) -> List[Dict[str, Any]]:
+        """
+        Read a markdown file and parse its headers.
+
+        Args:
+            markdown_path: Path to the markdown file
+
+        Returns:
+            List of dictionaries with header info (title, level, line)
+
+        Raises:
+            FileNotFoundError: If the markdown file doesn't exist
+            UnicodeDecodeError: If a header cannot be decoded with the
+                "strict" error handler
+        """
+        content, encoding = self.read_content(markdown_path)
+        return [
+            {"title": event["title"], "level": event["level"], "line": event["line"]}
+            for event in self.header_tokenizer.tokenize(content, encoding, self.errors)
+        ]
+
+    @staticmethod
+    def read_error_message(markdown_path: str, error: Exception) -> str:
+        """
+        Describe why a markdown file could not be read.
+
+        Args:
+            markdown_path: Path to the markdown file
+            error: The OSError or UnicodeDecodeError raised while reading it
+
+        Returns:
+            The message of the file's "io" finding
+        """
+        if isinstance(error, FileNotFoundError):
+            return f"Markdown file not found: {markdown_path}"
+        if isinstance(error, UnicodeDecodeError):
+            position = f"byte offset {error.start}"
+            if isinstance(error.object, bytes) and is_ascii_compatible(error.encoding):
+                line = error.object.count(b"\n", 0, error.start) + 1
+                position = f"line {line}, {position}"
+            return (
+                f"Cannot decode {markdown_path} as {error.encoding}: "
+                f"{error.reason} at {position}"
+            )
+        return f"Cannot read {markdown_path}: {error}"
+
+    def inspect_file(self, markdown_path: str) -> Dict[str, Any]:
+        """
+        Run every enabled rule over a markdown file.
+
+        Args:
+            markdown_path: Path to the markdown file
+
+        Returns:
+            Dictionary with the success flag, the structured findings and the
+            seconds spent per rule, as returned by RuleEngine.run
         """
         try:
-            with open(markdown_path, "r") as md_file:
-                content = md_file.read()
-        except FileNotFoundError:
-            return False, [f"Markdown file not found: {markdown_path}"]
+            content, encoding = self.read_content(markdown_path)
+            return self.engine.run(content, markdown_path, encoding, self.errors)
+        except (OSError, UnicodeDecodeError) as e:
+            message = self.read_error_message(markdown_path, e)
+        return {
+            "success": False,
+            "findings": [make_finding(IO_RULE, message)],
+            "timings": {},
+        }
 
-        # Parse the headers from the markdown file
-        actual_headers = self.header_validator.parse_markdown_headers(content)
+    def analyze_file(self, markdown_path: str) -> Tuple[bool, List[str]]:
+        """
+        Analyze a markdown file against the configuration requirements.
 
-        # Validate headers against configuration
-        return self.header_validator.validate_headers(actual_headers)
+        Args:
+            markdown_path: Path to the markdown file
+
+        Returns:
+            Tuple of (success_flag, list_of_validation_messages)
+        """
+        result = self.inspect_file(markdown_path)
+        return result["success"], [f["message"] for f in result["findings"]]
@@ -4,9 +4,24 @@ Command-line interface for Markdown Inspector.
 
 import sys
 import argparse
+import codecs
 import json
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from markdown_inspector.analyzer import MarkdownAnalyzer
+from markdown_inspector.features.autofix.core.batch_fixer import BatchFixer
+from markdown_inspector.features.batch_analysis.core.batch_analyzer import (
+    STATUS_BUDGET_EXCEEDED,
+    BatchAnalyzer,
+)
+from markdown_inspector.features.config_routing.core.router import ConfigRouter
+from markdown_inspector.features.config_routing.core.routed_analyzer import (
+    RoutedAnalyzer,
+)
+from markdown_inspector.features.config_routing.core.routed_fixer import RoutedFixer
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+)
 
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
@@ -24,17 +39,100 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     )
 
     parser.add_argument(
-        "--config", required=True, help="Path to the JSON configuration file"
+        "--config",
+        help="Path to the JSON configuration file (the default one when routing)",
     )
 
     parser.add_argument(
-        "--target", required=True, help="Path to the markdown file to analyze"
+        "--config-dir",
+        help="Directory of <doc-type>-docs-req.json files chosen by the "
+        "'doc-type' front matter key of each file",
+    )
+
+    parser.add_argument(
+        "--routing", help="Path to a JSON routing file choosing each file's config"
+    )
+
+    parser.add_argument(
+        "--target",
+        required=True,
+        nargs="+",
+        help="Path to the markdown file to analyze (several paths run in batch mode)",
     )
 
     parser.add_argument(
         "--verbose", action="store_true", help="Display detailed output"
     )
 
+    parser.add_argument(
+        "--jobs", type=int, help="Maximum number of worker processes in batch mode"
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Seconds the analysis of a single file may take in batch mode",
+    )
+
+    parser.add_argument(
+        "--size-budget",
+        type=int,
+        help="Size in bytes above which a file is not analyzed in batch mode",
+    )
+
+    parser.add_argument(
+        "--max-tasks-per-worker",
+        type=int,
+        default=100,
+        help="Files a worker analyzes before it is replaced (default: 100)",
+    )
+
+    parser.add_argument(
+        "--max-worker-memory",
+        type=int,
+        help="Resident memory in MB after which a worker is replaced",
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=["scalar", "vectorized"],
+        default="scalar",
+        help="Validation engine in batch mode; vectorized requires numpy "
+        "(default: scalar)",
+    )
+
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the time spent per rule, summed over the files in batch mode",
+    )
+
+    parser.add_argument(
+        "--encoding",
+        default=DEFAULT_ENCODING,
+        help="Encoding of markdown files without a byte order mark "
+        f"(default: {DEFAULT_ENCODING})",
+    )
+
+    parser.add_argument(
+        "--encoding-errors",
+        choices=["strict", "replace", "ignore", "backslashreplace"],
+        default=DEFAULT_ERRORS,
+        help=f"How undecodable bytes are handled (default: {DEFAULT_ERRORS})",
+    )
+
+    fix_mode = parser.add_mutually_exclusive_group()
+    fix_mode.add_argument(
+        "--fix",
+        action="store_true",
+        help="Fix heading levels and titles that differ only by case or whitespace",
+    )
+    fix_mode.add_argument(
+        "--fix-dry-run",
+        action="store_true",
+        help="Show the fixes --fix would make as a unified diff",
+    )
+
     parser.add_argument(
         "--output-format",
         choices=["text", "json"],
@@ -42,11 +140,25 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Format for the output (default: text)",
     )
 
-    return parser.parse_args(args)
+    parsed_args = parser.parse_args(args)
+    if parsed_args.config_dir and parsed_args.routing:
+        parser.error("--config-dir and --routing cannot be combined")
+    if not (parsed_args.config or parsed_args.config_dir or parsed_args.routing):
+        parser.error("one of --config, --config-dir or --routing is required")
+    try:
+        codecs.lookup(parsed_args.encoding)
+    except LookupError:
+        parser.error(f"unknown encoding: {parsed_args.encoding}")
+
+    return parsed_args
 
 
 def format_output(
-    success: bool, messages: List[str], output_format: str, verbose: bool = False
+    success: bool,
+    messages: List[str],
+    output_format: str,
+    verbose: bool = False,
+    timings: Optional[Dict[str, float]] = None,
 ) -> str:
     """
     Format the analysis output based on the specified format.
@@ -56,12 +168,15 @@ def format_output(
         messages: List of validation messages
         output_format: The output format (text or json)
         verbose: Whether to include verbose output
+        timings: Seconds spent per rule, included if given
 
     Returns:
         Formatted output string
     """
     if output_format == "json":
         result = {"success": success, "messages": messages}
+        if timings is not None:
+            result["timings"] = timings
 
         return json.dumps(result, indent=2)
     else:
@@ -73,9 +188,171 @@ def format_output(
             for message in messages:
                 result.append(f"- {message}")
 
+        if timings is not None:
+            result.append("Rule timings:")
+            for rule, seconds in timings.items():
+                result.append(f"- {rule}: {seconds * 1000:.3f} ms")
+
         return "\n".join(result)
 
 
+def format_batch_output(
+    report: Dict[str, Any],
+    output_format: str,
+    verbose: bool = False,
+    timings: bool = False,
+) -> str:
+    """
+    Format the batch analysis report based on the specified format.
+
+    Args:
+        report: Batch report as returned by BatchAnalyzer.analyze_files
+        output_format: The output format (text or json)
+        verbose: Whether to include verbose output
+        timings: Whether to include the seconds spent per rule
+
+    Returns:
+        Formatted output string
+    """
+    if not timings:
+        report = {key: value for key, value in report.items() if key != "timings"}
+    if output_format == "json":
+        return json.dumps(report, indent=2)
+
+    result = [f"Analysis {'succeeded' if report['success'] else 'failed'}"]
+    for path, file_result in report["results"].items():
+        success = file_result["success"]
+        if file_result.get("config"):
+            path = f"{path} ({file_result['config']})"
+        if file_result["status"] == STATUS_BUDGET_EXCEEDED:
+            result.append(f"{path}: budget exceeded")
+        else:
+            result.append(f"{path}: {'succeeded' if success else 'failed'}")
+
+        # Only show detailed messages if verbose or analysis failed
+        if verbose or not success:
+            for message in file_result["messages"]:
+                result.append(f"  - {message}")
+
+    if report["duplicate_groups"]:
+        result.append("Duplicate content:")
+        for group in report["duplicate_groups"]:
+            result.append(f"- {', '.join(group)}")
+
+    if timings:
+        result.append("Rule timings:")
+        for rule, seconds in report["timings"].items():
+            result.append(f"- {rule}: {seconds * 1000:.3f} ms")
+
+    return "\n".join(result)
+
+
+def format_fix_output(
+    report: Dict[str, Any], output_format: str, dry_run: bool = False
+) -> str:
+    """
+    Format the fix report based on the specified format.
+
+    Args:
+        report: Fix report as returned by BatchFixer.fix_files
+        output_format: The output format (text or json)
+        dry_run: Whether the report shows changes that were not written
+
+    Returns:
+        Formatted output string
+    """
+    if output_format == "json":
+        return json.dumps(report, indent=2)
+
+    result = []
+    for path, file_result in report["results"].items():
+        if "error" in file_result:
+            result.append(f"{path}: {file_result['error']}")
+        elif file_result["changed"] and dry_run:
+            result.append(file_result["diff"].rstrip("\n"))
+        elif file_result["changed"]:
+            result.append(f"{path}: fixed")
+            for fix in file_result["fixes"]:
+                result.append(f"  - {fix}")
+
+    changed = sum(1 for r in report["results"].values() if r["changed"])
+    result.append(
+        f"{changed} file{'' if changed == 1 else 's'} "
+        f"{'would be fixed' if dry_run else 'fixed'}"
+    )
+    return "\n".join(result)
+
+
+def build_router(parsed_args: argparse.Namespace) -> Optional[ConfigRouter]:
+    """
+    Build the config router requested by the arguments.
+
+    Args:
+        parsed_args: Parsed arguments namespace
+
+    Returns:
+        The router, with --config as its default, or None without routing
+    """
+    if parsed_args.routing:
+        router = ConfigRouter.load(parsed_args.routing)
+        if parsed_args.config:
+            router.default = parsed_args.config
+        return router
+    if parsed_args.config_dir:
+        return ConfigRouter.from_config_dir(
+            parsed_args.config_dir, default=parsed_args.config
+        )
+    return None
+
+
+def fix_targets(
+    parsed_args: argparse.Namespace, batch_options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Fix the headings of the targets against their configurations.
+
+    Args:
+        parsed_args: Parsed arguments namespace
+        batch_options: Worker pool options shared with batch analysis
+
+    Returns:
+        Fix report as returned by BatchFixer.fix_files, with the results of
+        all configurations
+    """
+    # Fixing shares every batch option except the analysis engine
+    fix_options = {
+        option: value for option, value in batch_options.items() if option != "engine"
+    }
+    router = build_router(parsed_args)
+    if router is not None:
+        batch_fixer = RoutedFixer(router, **fix_options)
+    else:
+        batch_fixer = BatchFixer(parsed_args.config, **fix_options)
+    return batch_fixer.fix_files(parsed_args.target, parsed_args.fix_dry_run)
+
+
+def uses_batch_mode(parsed_args: argparse.Namespace) -> bool:
+    """
+    Check whether the arguments request batch mode.
+
+    Args:
+        parsed_args: Parsed arguments namespace
+
+    Returns:
+        True for several targets, config routing or when a batch option is given
+    """
+    return (
+        len(parsed_args.target) > 1
+        or parsed_args.config_dir is not None
+        or parsed_args.routing is not None
+        or parsed_args.jobs is not None
+        or parsed_args.time_budget is not None
+        or parsed_args.size_budget is not None
+        or parsed_args.max_worker_memory is not None
+        or parsed_args.engine != "scalar"
+    )
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
@@ -89,12 +366,64 @@ def main(args: Optional[List[str]] = None) -> int:
     parsed_args = parse_args(args)
 
     try:
-        analyzer = MarkdownAnalyzer(parsed_args.config)
-        success, messages = analyzer.analyze_file(parsed_args.target)
+        max_worker_memory = parsed_args.max_worker_memory
+        batch_options = {
+            "jobs": parsed_args.jobs,
+            "time_budget": parsed_args.time_budget,
+            "size_budget": parsed_args.size_budget,
+            "max_tasks_per_worker": parsed_args.max_tasks_per_worker,
+            "max_worker_memory": (
+                max_worker_memory * 1024 * 1024 if max_worker_memory else None
+            ),
+            "engine": parsed_args.engine,
+            "encoding": parsed_args.encoding,
+            "encoding_errors": parsed_args.encoding_errors,
+        }
+
+        if parsed_args.fix or parsed_args.fix_dry_run:
+            report = fix_targets(parsed_args, batch_options)
+            print(
+                format_fix_output(
+                    report, parsed_args.output_format, parsed_args.fix_dry_run
+                )
+            )
+            if not report["success"]:
+                return 1
+            # A dry run fails like a check when any file would change
+            changed = any(r["changed"] for r in report["results"].values())
+            return 1 if parsed_args.fix_dry_run and changed else 0
+
+        if uses_batch_mode(parsed_args):
+            router = build_router(parsed_args)
+            if router is not None:
+                batch_analyzer = RoutedAnalyzer(router, **batch_options)
+            else:
+                batch_analyzer = BatchAnalyzer(parsed_args.config, **batch_options)
+            report = batch_analyzer.analyze_files(parsed_args.target)
+            print(
+                format_batch_output(
+                    report,
+                    parsed_args.output_format,
+                    parsed_args.verbose,
+                    parsed_args.timings,
+                )
+            )
+            return 0 if report["success"] else 1
+
+        analyzer = MarkdownAnalyzer(
+            parsed_args.config, parsed_args.encoding, parsed_args.encoding_errors
+        )
+        result = analyzer.inspect_file(parsed_args.target[0])
+        success = result["success"]
+        messages = [finding["message"] for finding in result["findings"]]
 
         # Format and print output
         output = format_output(
-            success, messages, parsed_args.output_format, parsed_args.verbose
+            success,
+            messages,
+            parsed_args.output_format,
+            parsed_args.verbose,
+            result["timings"] if parsed_args.timings else None,
         )
         print(output)
 
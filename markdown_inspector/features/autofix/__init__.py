@@ -0,0 +1,8 @@
+"""
+Autofix feature for markdown files.
+"""
+
+from markdown_inspector.features.autofix.core.batch_fixer import BatchFixer
+from markdown_inspector.features.autofix.core.fixer import HeaderFixer
+
+__all__ = ["BatchFixer", "HeaderFixer"]
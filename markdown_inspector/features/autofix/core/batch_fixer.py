@@ -0,0 +1,141 @@
+"""
+Batch fixing module for Markdown Inspector.
+Fixes the headings of many markdown files against one configuration.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from markdown_inspector.features.autofix.core.fixer import (
+    HeaderFixer,
+    remove_temp_files,
+)
+from markdown_inspector.features.batch_analysis.core.batch_runner import (
+    BatchRunner,
+)
+from markdown_inspector.features.batch_analysis.core.worker_pool import (
+    COMPLETED,
+    RAISED,
+    TIMED_OUT,
+)
+from markdown_inspector.features.header_validation.core.config_loader import (
+    ConfigLoader,
+)
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+)
+
+
+def create_file_fixer(
+    config_path: str,
+    dry_run: bool = False,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> Callable[[str], Dict[str, Any]]:
+    """
+    Build the fixing handler used by batch workers.
+
+    Args:
+        config_path: Path to the JSON configuration file
+        dry_run: Whether to report changes instead of writing them
+        encoding: Encoding of markdown files without a byte order mark
+        errors: Error handler for undecodable bytes in heading titles
+
+    Returns:
+        Callable fixing a single markdown file
+    """
+    fixer = HeaderFixer(ConfigLoader.load_config(config_path), encoding, errors)
+
+    def fix_file(markdown_path: str) -> Dict[str, Any]:
+        return fixer.fix_file(markdown_path, dry_run)
+
+    return fix_file
+
+
+class BatchFixer:
+    """Fixes the headings of a batch of markdown files."""
+
+    def __init__(
+        self,
+        config_path: str,
+        jobs: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        size_budget: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = 100,
+        max_worker_memory: Optional[int] = None,
+        encoding: str = DEFAULT_ENCODING,
+        encoding_errors: str = DEFAULT_ERRORS,
+    ):
+        """
+        Initialize the batch fixer with a configuration file.
+
+        Like BatchAnalyzer, files are fixed in this process unless more than
+        one job or a time budget is requested, in which case they run in a
+        worker pool.
+
+        Args:
+            config_path: Path to the JSON configuration file
+            jobs: Maximum number of worker processes
+            time_budget: Seconds fixing a single file may take
+            size_budget: Size in bytes above which a file is not fixed
+            max_tasks_per_worker: Files after which a worker is replaced
+            max_worker_memory: RSS in bytes after which a worker is replaced
+            encoding: Encoding of markdown files without a byte order mark
+            encoding_errors: Error handler for undecodable bytes
+        """
+        self.config_path = config_path
+        self.runner = BatchRunner(
+            jobs, time_budget, size_budget, max_tasks_per_worker, max_worker_memory
+        )
+        self.encoding = encoding
+        self.encoding_errors = encoding_errors
+
+    def fix_files(
+        self, markdown_paths: List[str], dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fix the headings of markdown files.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+            dry_run: Report the changes as unified diffs instead of writing them
+
+        Returns:
+            Dictionary with the overall success flag (no file failed to be
+            fixed) and the result of each file keyed by path, as returned by
+            HeaderFixer.fix_file plus an "error" for files that failed
+        """
+        # A file listed twice is fixed once
+        unique_paths = list(dict.fromkeys(markdown_paths))
+        within_budget, oversized = self.runner.split_by_size(unique_paths)
+        results: Dict[str, Dict[str, Any]] = {
+            path: {"changed": False, "fixes": [], "error": message}
+            for path, message in oversized.items()
+        }
+
+        outcomes = self.runner.run(
+            within_budget,
+            create_file_fixer,
+            (self.config_path, dry_run, self.encoding, self.encoding_errors),
+        )
+        for path in within_budget:
+            status, outcome = outcomes[path]
+            if status == COMPLETED:
+                results[path] = outcome
+                continue
+            # A killed worker may have been writing the file
+            remove_temp_files(path)
+            if status == RAISED:
+                error = f"Fix error: {outcome}"
+            elif status == TIMED_OUT:
+                error = (
+                    "Fixing exceeded the time budget of "
+                    f"{self.runner.time_budget} seconds"
+                )
+            else:
+                error = "Fix worker terminated unexpectedly"
+            results[path] = {"changed": False, "fixes": [], "error": error}
+
+        return {
+            "success": not any("error" in result for result in results.values()),
+            "results": {path: results[path] for path in unique_paths},
+        }
@@ -0,0 +1,329 @@
+"""
+Header fixer module for Markdown Inspector.
+Rewrites heading lines whose level or title mechanically differs from the
+configured requirements.
+"""
+
+import os
+import glob
+import difflib
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+from markdown_inspector.features.header_validation.core.matcher import HeadingMatcher
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+    detect_encoding,
+    prepare_content,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import (
+    HEADING,
+    HEADING_BYTES_PATTERN,
+    MarkdownTokenizer,
+)
+from markdown_inspector.features.toc.core.toc import (
+    find_list,
+    is_toc_heading,
+    render_toc,
+    toc_options,
+)
+
+# Suffix of the temporary files written next to the fixed files
+TEMP_SUFFIX = ".tmp"
+
+
+def fold_title(title: str) -> str:
+    """
+    Fold the case and whitespace of a header title.
+
+    Args:
+        title: The header title
+
+    Returns:
+        The title in lower case with runs of whitespace collapsed to one space
+    """
+    return " ".join(title.casefold().split())
+
+
+def remove_temp_files(path: str) -> List[str]:
+    """
+    Remove the temporary files write_atomically left for a file.
+
+    They remain when the process writing them is killed, such as a worker
+    stopped for exceeding the time budget.
+
+    Args:
+        path: Path of the file that was being replaced
+
+    Returns:
+        Paths of the removed temporary files
+    """
+    directory, name = os.path.split(os.path.realpath(path))
+    pattern = os.path.join(
+        glob.escape(directory), f".{glob.escape(name)}.*{TEMP_SUFFIX}"
+    )
+    removed = []
+    for temp_path in glob.glob(pattern):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            continue
+        removed.append(temp_path)
+    return removed
+
+
+def write_atomically(path: str, data: bytes) -> None:
+    """
+    Replace the content of a file in a single rename.
+
+    The data is written to a temporary file in the same directory, which then
+    replaces the original, so readers see either the old or the new content.
+    A symbolic link is followed, so the file it points to is replaced and the
+    link is kept.
+
+    Args:
+        path: Path of the file to replace
+        data: The new content
+    """
+    path = os.path.realpath(path)
+    directory, name = os.path.split(path)
+    descriptor, temp_path = tempfile.mkstemp(
+        prefix=f".{name}.", suffix=TEMP_SUFFIX, dir=directory
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as temp_file:
+            temp_file.write(data)
+        os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class HeaderFixer:
+    """Fixes heading levels and titles that differ only by case or whitespace."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ):
+        """
+        Initialize the fixer with configuration.
+
+        Only the flat "headings" requirements are fixed. A heading is renamed
+        when its title equals an exact required title up to case and
+        whitespace, and its level is changed when the requirement it matches
+        names another level. If the configuration enables the "toc" check,
+        the table of contents list is regenerated from the fixed headings.
+
+        Args:
+            config: Dictionary containing the validation configuration
+            encoding: Encoding of markdown files without a byte order mark
+            errors: Error handler for undecodable bytes in heading titles
+
+        Raises:
+            ValueError: If a heading requirement cannot be compiled
+        """
+        self.encoding = encoding
+        self.errors = errors
+        self.headings = config.get("headings", [])
+        self.matcher = HeadingMatcher(self.headings)
+        self.tokenizer = MarkdownTokenizer([HEADING])
+        self.toc_options = toc_options(config)
+
+        self.folded_titles: Dict[str, Tuple[int, str]] = {}
+        for index, heading in enumerate(self.headings):
+            titles = list(heading.get("titles", []))
+            if "title" in heading:
+                titles.insert(0, heading["title"])
+            for title in titles:
+                self.folded_titles.setdefault(fold_title(title), (index, title))
+
+    def plan_edits(self, data: bytes) -> Tuple[List[Tuple[int, int, bytes]], List[str]]:
+        """
+        Find the byte ranges to replace in a document.
+
+        The raw bytes are tokenized directly, so the offsets of heading lines
+        are byte offsets and only heading titles are decoded. Headings inside
+        code fences are left alone. A table of contents list is replaced as a
+        whole, and only when it differs from the regenerated one.
+
+        Args:
+            data: The raw content of the markdown file
+
+        Returns:
+            Tuple of (edits as (start, end, replacement) byte ranges in
+            document order, descriptions of the fixes)
+
+        Raises:
+            ValueError: If the file is not in an ASCII-compatible encoding
+        """
+        content, encoding = prepare_content(data, self.encoding, self.errors)
+        if not isinstance(content, bytes):
+            raise ValueError(f"Fixing {encoding} encoded files is not supported")
+
+        headers = []
+        for event in self.tokenizer.tokenize(data, encoding, self.errors):
+            if not event["in_fence"]:
+                title = event["title"]
+                headers.append((event, title, self.matcher.match(title)))
+
+        # A requirement some heading already satisfies is never renamed to
+        found = {index for _, _, index in headers if index is not None}
+        edits: List[Tuple[int, int, bytes]] = []
+        fixes: List[str] = []
+        fixed_headings: List[Dict[str, Any]] = []
+        for event, title, index in headers:
+            fixed_heading = dict(event)
+            fixed_headings.append(fixed_heading)
+            new_title = title
+            if index is None:
+                index, required_title = self.folded_titles.get(
+                    fold_title(title), (None, None)
+                )
+                if index is None or index in found:
+                    continue
+                found.add(index)
+                new_title = required_title
+
+            level = self.headings[index].get("level")
+            if level is None:
+                level = event["level"]
+            fixed_heading.update(title=new_title, level=level)
+            if new_title == title and level == event["level"]:
+                continue
+
+            line_end = data.find(b"\n", event["offset"])
+            if line_end == -1:
+                line_end = len(data)
+            if data.endswith(b"\r", 0, line_end):
+                line_end -= 1
+            match = HEADING_BYTES_PATTERN.match(data, event["offset"], line_end)
+            if level != event["level"]:
+                edits.append((match.start(1), match.end(1), b"#" * level))
+                fixes.append(
+                    f"Line {event['line']}: changed the level of '{new_title}' "
+                    f"from {event['level']} to {level}"
+                )
+            if new_title != title:
+                raw_title = match.group(2)
+                start = match.start(2) + len(raw_title) - len(raw_title.lstrip())
+                end = match.end(2) - len(raw_title) + len(raw_title.rstrip())
+                edits.append((start, end, new_title.encode(encoding)))
+                fixes.append(
+                    f"Line {event['line']}: renamed '{title}' to '{new_title}'"
+                )
+
+        if self.toc_options is not None:
+            toc_edit = self._toc_edit(data, fixed_headings, encoding)
+            if toc_edit is not None:
+                start, end, toc, line = toc_edit
+                # Keep edits and fixes in document order
+                edits.append((start, end, toc))
+                edits.sort(key=lambda edit: edit[:2])
+                position = sum(1 for edit in edits if edit[0] < start)
+                fixes.insert(
+                    position, f"Line {line}: regenerated the table of contents"
+                )
+
+        return edits, fixes
+
+    def _toc_edit(
+        self, data: bytes, headings: List[Dict[str, Any]], encoding: str
+    ) -> Optional[Tuple[int, int, bytes, int]]:
+        """
+        Regenerate the table of contents list from the fixed headings.
+
+        Args:
+            data: The raw content of the markdown file
+            headings: Headings outside code fences with their fixed titles
+                and levels, in document order
+            encoding: Encoding of the file
+
+        Returns:
+            Tuple of (start, end, replacement, line of the table of contents
+            heading), or None if the document has no table of contents or
+            its list is up to date
+        """
+        for position, heading in enumerate(headings):
+            if is_toc_heading(heading["title"], self.toc_options):
+                break
+        else:
+            return None
+
+        line_end = data.find(b"\n", heading["offset"])
+        if line_end == -1:
+            return None
+        newline = "\r\n" if data.endswith(b"\r", 0, line_end) else "\n"
+        end = len(data)
+        if position + 1 < len(headings):
+            end = headings[position + 1]["offset"]
+
+        start, end = find_list(data, line_end + 1, end)
+        toc = render_toc(headings, self.toc_options, newline).encode(encoding)
+        if data[start:end] == toc:
+            return None
+        return start, end, toc, heading["line"]
+
+    @staticmethod
+    def apply_edits(data: bytes, edits: List[Tuple[int, int, bytes]]) -> bytes:
+        """
+        Splice replacements into a document.
+
+        Args:
+            data: The raw content of the markdown file
+            edits: Non-overlapping (start, end, replacement) ranges in order
+
+        Returns:
+            The patched content; bytes outside the edited ranges are unchanged
+        """
+        parts = []
+        position = 0
+        for start, end, replacement in edits:
+            parts.append(data[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(data[position:])
+        return b"".join(parts)
+
+    def fix_file(self, markdown_path: str, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Fix the headings of a markdown file.
+
+        Args:
+            markdown_path: Path to the markdown file
+            dry_run: Report the changes as a unified diff instead of writing them
+
+        Returns:
+            Dictionary with whether the file needs or got changes, the
+            descriptions of the fixes, and the unified diff in dry-run mode
+
+        Raises:
+            FileNotFoundError: If the markdown file doesn't exist
+            ValueError: If the file is not in an ASCII-compatible encoding
+        """
+        with open(markdown_path, "rb") as md_file:
+            data = md_file.read()
+
+        edits, fixes = self.plan_edits(data)
+        result: Dict[str, Any] = {"changed": bool(edits), "fixes": fixes}
+        if not edits:
+            return result
+
+        fixed = self.apply_edits(data, edits)
+        if dry_run:
+            encoding = detect_encoding(data, self.encoding)
+            result["diff"] = "".join(
+                difflib.unified_diff(
+                    data.decode(encoding, "replace").splitlines(True),
+                    fixed.decode(encoding, "replace").splitlines(True),
+                    fromfile=markdown_path,
+                    tofile=markdown_path,
+                )
+            )
+        else:
+            write_atomically(markdown_path, fixed)
+        return result
@@ -0,0 +1,124 @@
+"""
+Tests for the batch fixer module.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from markdown_inspector.features.autofix.core import batch_fixer
+from markdown_inspector.features.autofix.core.batch_fixer import BatchFixer
+
+
+def _hang_while_writing(markdown_path):
+    """Fixing handler that is killed halfway through writing its file."""
+    directory, name = os.path.split(markdown_path)
+    with open(os.path.join(directory, f".{name}.abc123.tmp"), "wb") as temp_file:
+        temp_file.write(b"partial")
+    time.sleep(30)
+
+
+def _create_hanging_fixer(*args):
+    """Factory of the hanging handler."""
+    return _hang_while_writing
+
+
+class TestBatchFixer(unittest.TestCase):
+    """Test cases for the BatchFixer."""
+
+    def setUp(self):
+        """Set up a configuration and markdown files in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "config.json")
+        with open(self.config_path, "w") as config_file:
+            json.dump(
+                {
+                    "headings": [
+                        {"title": "Test Document", "level": 1},
+                        {"title": "Section One", "level": 2},
+                    ]
+                },
+                config_file,
+            )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        """Helper to write a markdown file."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def _check_batch(self, batch_fixer):
+        """Helper to fix a batch and check the results."""
+        broken = self._write("broken.md", "# test document\n### Section One\n")
+        valid = self._write("valid.md", "# Test Document\n## Section One\n")
+        missing = os.path.join(self.temp_dir, "missing.md")
+
+        report = batch_fixer.fix_files([broken, valid, missing, broken])
+
+        self.assertFalse(report["success"])
+        self.assertEqual(list(report["results"]), [broken, valid, missing])
+        self.assertTrue(report["results"][broken]["changed"])
+        self.assertFalse(report["results"][valid]["changed"])
+        self.assertIn("error", report["results"][missing])
+        with open(broken, "r") as file:
+            self.assertEqual(file.read(), "# Test Document\n## Section One\n")
+
+    def test_fix_in_process(self):
+        """Test fixing a batch in this process."""
+        self._check_batch(BatchFixer(self.config_path))
+
+    def test_fix_in_worker_pool(self):
+        """Test fixing a batch in worker processes."""
+        self._check_batch(BatchFixer(self.config_path, jobs=2))
+
+    def test_dry_run(self):
+        """Test that a dry run leaves the files unchanged."""
+        path = self._write("broken.md", "# Test Document\n### Section One\n")
+
+        report = BatchFixer(self.config_path).fix_files([path], dry_run=True)
+
+        self.assertTrue(report["success"])
+        self.assertIn("+## Section One", report["results"][path]["diff"])
+        with open(path, "r") as file:
+            self.assertEqual(file.read(), "# Test Document\n### Section One\n")
+
+    def test_size_budget(self):
+        """Test that files over the size budget are not fixed."""
+        small = self._write("small.md", "# test document\n")
+        large = self._write("large.md", "# test document\n" + "x" * 100)
+        batch_fixer = BatchFixer(self.config_path, size_budget=50)
+
+        report = batch_fixer.fix_files([large, small])
+
+        self.assertFalse(report["success"])
+        self.assertEqual(list(report["results"]), [large, small])
+        self.assertTrue(report["results"][small]["changed"])
+        self.assertEqual(
+            report["results"][large]["error"],
+            "File size of 116 bytes exceeds the size budget of 50 bytes",
+        )
+        with open(large, "r") as file:
+            self.assertTrue(file.read().startswith("# test document\n"))
+
+    def test_timed_out_write_leaves_no_temp_file(self):
+        """Test that a worker killed while writing leaves no temporary file."""
+        path = self._write("doc.md", "# test document\n")
+
+        with patch.object(batch_fixer, "create_file_fixer", _create_hanging_fixer):
+            report = BatchFixer(self.config_path, time_budget=0.5).fix_files([path])
+
+        self.assertIn("time budget", report["results"][path]["error"])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["config.json", "doc.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Tests for the header fixer module.
+"""
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from markdown_inspector.features.autofix.core.fixer import (
+    HeaderFixer,
+    fold_title,
+    remove_temp_files,
+    write_atomically,
+)
+
+
+class TestHeaderFixer(unittest.TestCase):
+    """Test cases for the HeaderFixer."""
+
+    def setUp(self):
+        """Set up a fixer and a temporary directory."""
+        self.fixer = HeaderFixer(
+            {
+                "headings": [
+                    {"title": "Test Document", "level": 1},
+                    {"title": "Getting Started", "level": 2},
+                    {"pattern": "Step \\d+", "level": 3},
+                ]
+            }
+        )
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, content):
+        """Helper to write a markdown file in binary mode."""
+        path = os.path.join(self.temp_dir, "doc.md")
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def _read(self, path):
+        """Helper to read a markdown file in binary mode."""
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_fold_title(self):
+        """Test that case and whitespace are folded."""
+        self.assertEqual(fold_title("  Getting \t STARTED "), "getting started")
+
+    def test_fixes_levels_and_titles(self):
+        """Test that only the affected parts of heading lines are rewritten."""
+        path = self._write(
+            b"# Test Document\r\n"
+            b"\r\n"
+            b"### getting  started ###\r\n"
+            b"Body text stays as it is.\r\n"
+            b"#### Step 1\r\n"
+        )
+
+        result = self.fixer.fix_file(path)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(len(result["fixes"]), 3)
+        self.assertEqual(
+            self._read(path),
+            b"# Test Document\r\n"
+            b"\r\n"
+            b"## Getting Started ###\r\n"
+            b"Body text stays as it is.\r\n"
+            b"### Step 1\r\n",
+        )
+
+    def test_leaves_other_headings_alone(self):
+        """Test that fenced, unrelated and already satisfied headings are kept."""
+        content = (
+            b"# Test Document\n"
+            b"## Getting Started\n"
+            b"## getting started\n"
+            b"```\n"
+            b"# test document\n"
+            b"```\n"
+            b"## Getting Started Quickly\n"
+        )
+        path = self._write(content)
+
+        result = self.fixer.fix_file(path)
+
+        self.assertFalse(result["changed"])
+        self.assertEqual(self._read(path), content)
+
+    def test_non_ascii_titles(self):
+        """Test that byte offsets stay correct around multi-byte characters."""
+        fixer = HeaderFixer({"headings": [{"title": "Überblick", "level": 2}]})
+        path = self._write("# Café\n# ÜBERBLICK\n".encode("utf-8"))
+
+        fixer.fix_file(path)
+
+        self.assertEqual(self._read(path), "# Café\n## Überblick\n".encode("utf-8"))
+
+    def test_regenerates_toc(self):
+        """Test that the table of contents is rebuilt from the fixed headings."""
+        fixer = HeaderFixer({"headings": [{"title": "Usage", "level": 2}], "toc": True})
+        path = self._write(
+            b"# Guide\r\n"
+            b"## Table of Contents\r\n"
+            b"Sections:\r\n"
+            b"- [Old](#old)\r\n"
+            b"\r\n"
+            b"## usage\r\n"
+            b"### Options\r\n"
+        )
+
+        result = fixer.fix_file(path)
+
+        self.assertEqual(
+            result["fixes"],
+            [
+                "Line 2: regenerated the table of contents",
+                "Line 6: renamed 'usage' to 'Usage'",
+            ],
+        )
+        self.assertEqual(
+            self._read(path),
+            b"# Guide\r\n"
+            b"## Table of Contents\r\n"
+            b"Sections:\r\n"
+            b"- [Usage](#usage)\r\n"
+            b"  - [Options](#options)\r\n"
+            b"\r\n"
+            b"## Usage\r\n"
+            b"### Options\r\n",
+        )
+        self.assertFalse(fixer.fix_file(path)["changed"])
+
+    def test_unsupported_encoding(self):
+        """Test that files that must be decoded in full are not fixed."""
+        path = self._write("### Getting Started\n".encode("utf-16"))
+
+        with self.assertRaises(ValueError):
+            self.fixer.fix_file(path)
+
+    def test_dry_run(self):
+        """Test that a dry run reports a unified diff without writing."""
+        content = b"# Test Document\n### Getting Started\n"
+        path = self._write(content)
+
+        result = self.fixer.fix_file(path, dry_run=True)
+
+        self.assertTrue(result["changed"])
+        self.assertIn("-### Getting Started\n", result["diff"])
+        self.assertIn("+## Getting Started\n", result["diff"])
+        self.assertEqual(self._read(path), content)
+
+    def test_write_atomically(self):
+        """Test that the replaced file keeps its mode and leaves no temp file."""
+        path = self._write(b"old")
+        os.chmod(path, 0o640)
+
+        write_atomically(path, b"new")
+
+        self.assertEqual(self._read(path), b"new")
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+        self.assertEqual(os.listdir(self.temp_dir), ["doc.md"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symbolic links are not supported")
+    def test_write_atomically_through_symlink(self):
+        """Test that a symbolic link is kept and the file it points to is replaced."""
+        target = self._write(b"old")
+        link = os.path.join(self.temp_dir, "link.md")
+        os.symlink(target, link)
+
+        write_atomically(link, b"new")
+
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(self._read(target), b"new")
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["doc.md", "link.md"])
+
+    def test_remove_temp_files(self):
+        """Test that only the temporary files of the given file are removed."""
+        path = self._write(b"old")
+        stale = os.path.join(self.temp_dir, ".doc.md.abc123.tmp")
+        other = os.path.join(self.temp_dir, ".other.md.abc123.tmp")
+        for temp_path in (stale, other):
+            with open(temp_path, "wb") as temp_file:
+                temp_file.write(b"partial")
+
+        self.assertEqual(remove_temp_files(path), [stale])
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)), [".other.md.abc123.tmp", "doc.md"]
+        )
+
+    def test_nonexistent_file(self):
+        """Test that a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            self.fixer.fix_file(os.path.join(self.temp_dir, "missing.md"))
+
+
+if __name__ == "__main__":
+    unittest.main()
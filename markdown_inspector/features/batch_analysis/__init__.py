@@ -0,0 +1,23 @@
+"""
+Batch analysis feature for markdown files.
+"""
+
+from markdown_inspector.features.batch_analysis.core.batch_analyzer import (
+    BatchAnalyzer,
+)
+from markdown_inspector.features.batch_analysis.core.batch_runner import BatchRunner
+from markdown_inspector.features.batch_analysis.core.deduplicator import (
+    ContentDeduplicator,
+)
+from markdown_inspector.features.batch_analysis.core.vectorized import (
+    VectorizedValidator,
+)
+from markdown_inspector.features.batch_analysis.core.worker_pool import WorkerPool
+
+__all__ = [
+    "BatchAnalyzer",
+    "BatchRunner",
+    "ContentDeduplicator",
+    "VectorizedValidator",
+    "WorkerPool",
+]
@@ -0,0 +1,3 @@
+"""
+Core functionality for batch analysis feature.
+"""
@@ -0,0 +1,302 @@
+"""
+Batch analysis module for Markdown Inspector.
+Analyzes many markdown files against one configuration in a single run.
+"""
+
+import time
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+from markdown_inspector.analyzer import IO_RULE, MarkdownAnalyzer
+from markdown_inspector.features.batch_analysis.core.batch_runner import (
+    BatchRunner,
+)
+from markdown_inspector.features.batch_analysis.core.deduplicator import (
+    ContentDeduplicator,
+)
+from markdown_inspector.features.batch_analysis.core.vectorized import (
+    VectorizedValidator,
+)
+from markdown_inspector.features.batch_analysis.core.worker_pool import (
+    COMPLETED,
+    RAISED,
+    TIMED_OUT,
+)
+from markdown_inspector.features.header_validation.core.plugin import (
+    HeaderValidationRule,
+)
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+)
+
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_BUDGET_EXCEEDED = "budget_exceeded"
+
+
+def create_file_analyzer(
+    config_path: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> Callable[[str], Dict[str, Any]]:
+    """
+    Build the analysis handler used by batch workers.
+
+    Args:
+        config_path: Path to the JSON configuration file
+        encoding: Encoding of markdown files without a byte order mark
+        errors: Error handler for undecodable bytes
+
+    Returns:
+        Callable inspecting a single markdown file, as
+        MarkdownAnalyzer.inspect_file
+    """
+    return MarkdownAnalyzer(config_path, encoding, errors).inspect_file
+
+
+def create_header_reader(
+    config_path: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> Callable[[str], Tuple[Optional[List[Dict[str, Any]]], Optional[str]]]:
+    """
+    Build the header reading handler used by batch workers of the vectorized engine.
+
+    Args:
+        config_path: Path to the JSON configuration file
+        encoding: Encoding of markdown files without a byte order mark
+        errors: Error handler for undecodable bytes
+
+    Returns:
+        Callable returning a tuple of (headers, None) for a markdown file, or
+        (None, message) if the file cannot be read or decoded
+    """
+    analyzer = MarkdownAnalyzer(config_path, encoding, errors)
+
+    def read_headers(
+        markdown_path: str,
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        try:
+            return analyzer.read_headers(markdown_path), None
+        except (OSError, UnicodeDecodeError) as e:
+            return None, analyzer.read_error_message(markdown_path, e)
+
+    return read_headers
+
+
+class BatchAnalyzer:
+    """Analyzes a batch of markdown files, validating each unique content once."""
+
+    def __init__(
+        self,
+        config_path: str,
+        jobs: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        size_budget: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = 100,
+        max_worker_memory: Optional[int] = None,
+        engine: str = "scalar",
+        encoding: str = DEFAULT_ENCODING,
+        encoding_errors: str = DEFAULT_ERRORS,
+    ):
+        """
+        Initialize the batch analyzer with a configuration file.
+
+        Files are analyzed in this process unless more than one job or a time
+        budget is requested, in which case they run in a worker pool.
+
+        Args:
+            config_path: Path to the JSON configuration file
+            jobs: Maximum number of worker processes
+            time_budget: Seconds the analysis of a single file may take
+            size_budget: Size in bytes above which a file is not analyzed
+            max_tasks_per_worker: Files after which a worker is replaced
+            max_worker_memory: RSS in bytes after which a worker is replaced
+            engine: "scalar" to validate file by file, or "vectorized" to
+                validate all files at once with NumPy. Configurations the
+                vectorized engine does not support, or that enable rules other
+                than header validation, fall back to "scalar"
+            encoding: Encoding of markdown files without a byte order mark
+            encoding_errors: Error handler for undecodable bytes
+
+        Raises:
+            ValueError: If the engine is unknown
+            ImportError: If the vectorized engine is requested without NumPy
+            LookupError: If the encoding or error handler is unknown
+        """
+        self.config_path = config_path
+        self.analyzer = MarkdownAnalyzer(config_path, encoding, encoding_errors)
+        self.encoding = encoding
+        self.encoding_errors = encoding_errors
+        self.deduplicator = ContentDeduplicator()
+        self.runner = BatchRunner(
+            jobs, time_budget, size_budget, max_tasks_per_worker, max_worker_memory
+        )
+
+        if engine not in ("scalar", "vectorized"):
+            raise ValueError(f"Unknown batch engine: {engine}")
+        # Only header validation is vectorized, so any other enabled rule
+        # keeps the scalar engine
+        rules = [plugin.name for plugin in self.analyzer.engine.plugins]
+        self.vectorized_validator = None
+        if (
+            engine == "vectorized"
+            and rules == [HeaderValidationRule.name]
+            and VectorizedValidator.supports(self.analyzer.config)
+        ):
+            self.vectorized_validator = VectorizedValidator(
+                self.analyzer.header_validator
+            )
+        # Files with identical content share one result unless a rule
+        # depends on the path of the file
+        self.shares_results = not any(
+            plugin.uses_path for plugin in self.analyzer.engine.plugins
+        )
+
+    @staticmethod
+    def _file_result(success: bool, messages: List[str]) -> Dict[str, Any]:
+        """Build the result entry of an analyzed file."""
+        return {
+            "success": success,
+            "status": STATUS_PASSED if success else STATUS_FAILED,
+            "messages": messages,
+        }
+
+    @staticmethod
+    def _add_timings(total: Dict[str, float], timings: Dict[str, float]) -> None:
+        """Add the seconds spent per rule to a running total."""
+        for rule, seconds in timings.items():
+            total[rule] = total.get(rule, 0.0) + seconds
+
+    def _analyze_representatives(
+        self, paths: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[str], Dict[str, float]]:
+        """
+        Analyze one file per group of identical content.
+
+        Args:
+            paths: Representative paths to analyze
+
+        Returns:
+            Tuple of (dictionary mapping each path to its result, paths whose
+            result names the file, such as read errors, and so cannot be
+            shared with identical files, seconds spent per rule)
+        """
+        vectorized = self.vectorized_validator is not None
+        factory_args = (self.config_path, self.encoding, self.encoding_errors)
+        if vectorized:
+            outcomes = self.runner.run(paths, create_header_reader, factory_args)
+        else:
+            outcomes = self.runner.run(
+                paths, create_file_analyzer, factory_args, self.analyzer.inspect_file
+            )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        path_dependent: Set[str] = set()
+        timings: Dict[str, float] = {}
+        header_lists = {}
+        for path, (status, outcome) in outcomes.items():
+            if status == COMPLETED and vectorized:
+                headers, error = outcome
+                if error is not None:
+                    results[path] = self._file_result(False, [error])
+                    path_dependent.add(path)
+                else:
+                    header_lists[path] = headers
+            elif status == COMPLETED:
+                findings = outcome["findings"]
+                results[path] = self._file_result(
+                    outcome["success"], [f["message"] for f in findings]
+                )
+                if any(f["rule"] == IO_RULE for f in findings):
+                    path_dependent.add(path)
+                self._add_timings(timings, outcome["timings"])
+            elif status == RAISED:
+                results[path] = self._file_result(False, [f"Analysis error: {outcome}"])
+                path_dependent.add(path)
+            elif status == TIMED_OUT:
+                results[path] = {
+                    "success": False,
+                    "status": STATUS_BUDGET_EXCEEDED,
+                    "messages": [
+                        "Analysis exceeded the time budget of "
+                        f"{self.runner.time_budget} seconds"
+                    ],
+                }
+            else:
+                results[path] = self._file_result(
+                    False, ["Analysis worker terminated unexpectedly"]
+                )
+
+        if header_lists:
+            started = time.perf_counter()
+            validated = self.vectorized_validator.validate_corpus(
+                list(header_lists.values())
+            )
+            self._add_timings(
+                timings, {HeaderValidationRule.name: time.perf_counter() - started}
+            )
+            for path, (success, messages) in zip(header_lists, validated):
+                results[path] = self._file_result(success, messages)
+        return results, path_dependent, timings
+
+    def analyze_files(self, markdown_paths: List[str]) -> Dict[str, Any]:
+        """
+        Analyze markdown files against the configuration requirements.
+
+        Files with byte-identical content are parsed and validated once and the
+        result is shared by every path in the group. Files over the size or
+        time budget are reported with the 'budget_exceeded' status.
+
+        The seconds spent per rule are summed over the files actually
+        analyzed, so identical files validated once are counted once. The
+        vectorized engine reports the validation of the whole batch under
+        header validation.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+
+        Returns:
+            Dictionary with the overall success flag, the result of each file
+            keyed by path, the groups of paths sharing identical content and
+            the seconds spent per rule
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        within_budget, oversized = self.runner.split_by_size(markdown_paths)
+        for path, message in oversized.items():
+            results[path] = {
+                "success": False,
+                "status": STATUS_BUDGET_EXCEEDED,
+                "messages": [message],
+            }
+
+        groups = self.deduplicator.group_identical(within_budget)
+        if self.shares_results:
+            representatives = [group[0] for group in groups]
+        else:
+            representatives = [path for group in groups for path in group]
+        group_results, path_dependent, timings = self._analyze_representatives(
+            representatives
+        )
+        # A result naming its file is redone for the other identical files
+        unshared = [
+            path for group in groups if group[0] in path_dependent for path in group[1:]
+        ]
+        if unshared:
+            unshared_results, _, unshared_timings = self._analyze_representatives(
+                unshared
+            )
+            group_results.update(unshared_results)
+            self._add_timings(timings, unshared_timings)
+
+        for group in groups:
+            for path in group:
+                result = group_results.get(path, group_results[group[0]])
+                results[path] = dict(result, messages=list(result["messages"]))
+
+        ordered_results = {path: results[path] for path in markdown_paths}
+        return {
+            "success": all(result["success"] for result in results.values()),
+            "results": ordered_results,
+            "duplicate_groups": [group for group in groups if len(group) > 1],
+            "timings": timings,
+        }
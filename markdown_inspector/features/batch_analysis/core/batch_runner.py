@@ -0,0 +1,121 @@
+"""
+Batch runner module for Markdown Inspector.
+Runs a per-file handler over a batch, in this process or in a worker pool,
+within the time and size budgets shared by batch analysis and fixing.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from markdown_inspector.features.batch_analysis.core.worker_pool import (
+    COMPLETED,
+    RAISED,
+    WorkerPool,
+)
+
+
+class BatchRunner:
+    """Runs a file handler over a batch within time and size budgets."""
+
+    def __init__(
+        self,
+        jobs: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        size_budget: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = 100,
+        max_worker_memory: Optional[int] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Files are handled in this process unless more than one job or a time
+        budget is requested, in which case they run in a worker pool.
+
+        Args:
+            jobs: Maximum number of worker processes
+            time_budget: Seconds handling a single file may take
+            size_budget: Size in bytes above which a file is not handled
+            max_tasks_per_worker: Files after which a worker is replaced
+            max_worker_memory: RSS in bytes after which a worker is replaced
+        """
+        self.jobs = jobs
+        self.time_budget = time_budget
+        self.size_budget = size_budget
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_memory = max_worker_memory
+
+    def uses_pool(self) -> bool:
+        """Check whether files are handled in worker processes."""
+        if self.time_budget is not None:
+            return True
+        return self.jobs is not None and self.jobs > 1
+
+    def split_by_size(self, paths: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Set aside the files over the size budget.
+
+        Files that cannot be checked are kept so that their handler can
+        report them.
+
+        Args:
+            paths: Paths of the files
+
+        Returns:
+            Tuple of (paths within the budget, message of each path over it)
+        """
+        within_budget = []
+        oversized = {}
+        for path in paths:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = None
+            if self.size_budget is None or size is None or size <= self.size_budget:
+                within_budget.append(path)
+            else:
+                oversized[path] = (
+                    f"File size of {size} bytes exceeds the size budget of "
+                    f"{self.size_budget} bytes"
+                )
+        return within_budget, oversized
+
+    def run(
+        self,
+        paths: List[str],
+        factory: Callable,
+        factory_args: Tuple = (),
+        handler: Optional[Callable[[str], Any]] = None,
+    ) -> Dict[str, Tuple[str, Any]]:
+        """
+        Run a handler over every file.
+
+        Args:
+            paths: Paths of the files
+            factory: Picklable callable returning the handler of a worker
+            factory_args: Arguments passed to the factory
+            handler: Handler to use in this process instead of building one
+
+        Returns:
+            Dictionary mapping each path to a (status, result) tuple, as
+            returned by WorkerPool.run. Errors are kept per file in this
+            process too
+        """
+        if self.uses_pool():
+            pool = WorkerPool(
+                factory,
+                factory_args,
+                max_workers=self.jobs,
+                time_budget=self.time_budget,
+                max_tasks_per_worker=self.max_tasks_per_worker,
+                max_worker_memory=self.max_worker_memory,
+            )
+            return pool.run(paths)
+
+        if handler is None:
+            handler = factory(*factory_args)
+        outcomes = {}
+        for path in paths:
+            try:
+                outcomes[path] = (COMPLETED, handler(path))
+            except Exception as e:
+                outcomes[path] = (RAISED, str(e))
+        return outcomes
@@ -0,0 +1,90 @@
+"""
+Content deduplication module for Markdown Inspector.
+Groups markdown files with byte-identical content so each is analyzed once.
+"""
+
+import os
+import hashlib
+from typing import Dict, List
+
+
+class ContentDeduplicator:
+    """Groups files with identical content by size and content hash."""
+
+    def __init__(self, chunk_size: int = 1024 * 1024):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            chunk_size: Number of bytes read at a time while hashing a file
+        """
+        self.chunk_size = chunk_size
+
+    def hash_file(self, path: str) -> bytes:
+        """
+        Compute a content hash for a file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Digest of the file content
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(self.chunk_size), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    def group_identical(self, paths: List[str]) -> List[List[str]]:
+        """
+        Group paths whose files have byte-identical content.
+
+        Files are first grouped by size; only files sharing a size with another
+        file are hashed. Files that cannot be read are kept in groups of their
+        own so the analysis can report them. Repeated paths are ignored.
+
+        Args:
+            paths: Paths of the files to group
+
+        Returns:
+            List of groups in order of first appearance, each a list of paths
+        """
+        groups: List[List[str]] = []
+        by_size: Dict[int, List[str]] = {}
+        position: Dict[str, int] = {}
+        for path in paths:
+            if path in position:
+                continue
+            position[path] = len(position)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                groups.append([path])
+                continue
+            if size not in by_size:
+                by_size[size] = []
+                groups.append(by_size[size])
+            by_size[size].append(path)
+
+        result: List[List[str]] = []
+        for group in groups:
+            if len(group) == 1:
+                result.append(group)
+                continue
+
+            by_hash: Dict[bytes, List[str]] = {}
+            for path in group:
+                try:
+                    key = self.hash_file(path)
+                except OSError:
+                    result.append([path])
+                    continue
+                if key not in by_hash:
+                    by_hash[key] = []
+                    result.append(by_hash[key])
+                by_hash[key].append(path)
+
+        # Restore the order in which the groups' first paths were given
+        result.sort(key=lambda group: position[group[0]])
+        return result
@@ -0,0 +1,136 @@
+"""
+Vectorized validation module for Markdown Inspector.
+Validates the headers of a whole corpus at once with NumPy array operations.
+"""
+
+from typing import Any, Dict, List, Tuple
+from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+class VectorizedValidator:
+    """Validates many header lists against one configuration with NumPy."""
+
+    def __init__(self, header_validator: HeaderValidator):
+        """
+        Initialize the vectorized validator.
+
+        Args:
+            header_validator: Validator of the configuration, used for title
+                classification and for the messages of failing files
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "The vectorized engine requires numpy (pip install numpy)"
+            )
+        self.header_validator = header_validator
+        headings = header_validator.config.get("headings", [])
+        self.required_count = len(headings)
+        # A level of -1 means the requirement accepts any level
+        self.expected_levels = np.array(
+            [heading.get("level", -1) for heading in headings], dtype=np.int64
+        )
+        # Config position of every title seen so far, -1 for additional headers
+        self.title_ids: Dict[str, int] = {}
+
+    @staticmethod
+    def supports(config: Dict[str, Any]) -> bool:
+        """
+        Check whether a configuration can be validated by this engine.
+
+        Only flat "headings" requirements are vectorized; configurations with
+        nested "sections" must use the scalar validator.
+
+        Args:
+            config: The configuration dictionary
+
+        Returns:
+            True if the engine can validate the configuration
+        """
+        return "headings" in config and "sections" not in config
+
+    def _title_id(self, title: str) -> int:
+        """Look up the config position of a title through the shared table."""
+        title_id = self.title_ids.get(title)
+        if title_id is None:
+            index = self.header_validator.matcher.match(title)
+            title_id = -1 if index is None else index
+            self.title_ids[title] = title_id
+        return title_id
+
+    def validate_corpus(
+        self, header_lists: List[List[Dict[str, Any]]]
+    ) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate the headers of many files at once.
+
+        All headers are encoded as flat arrays of config positions, levels and
+        the index of the file segment they belong to. The missing,
+        out-of-order and level checks run over the whole corpus as array
+        operations; only failing files are passed to the scalar validator to
+        build their messages, so the output is identical to it.
+
+        Args:
+            header_lists: Parsed headers of each file
+
+        Returns:
+            List of (success_flag, list_of_validation_messages) per file
+        """
+        file_count = len(header_lists)
+        counts = np.fromiter(
+            (len(headers) for headers in header_lists), dtype=np.int64, count=file_count
+        )
+        total = int(counts.sum())
+
+        positions = np.fromiter(
+            (
+                self._title_id(header["title"])
+                for headers in header_lists
+                for header in headers
+            ),
+            dtype=np.int64,
+            count=total,
+        )
+        levels = np.fromiter(
+            (header["level"] for headers in header_lists for header in headers),
+            dtype=np.int64,
+            count=total,
+        )
+        file_ids = np.repeat(np.arange(file_count), counts)
+
+        matched = positions >= 0
+        matched_positions = positions[matched]
+        matched_levels = levels[matched]
+        matched_files = file_ids[matched]
+
+        # Missing headers: a requirement without any matching header in the file
+        present = np.zeros((file_count, self.required_count), dtype=bool)
+        present[matched_files, matched_positions] = True
+        failing = ~present.all(axis=1)
+
+        # Order: a matched header before the previous one of the same file
+        if len(matched_positions) > 1:
+            out_of_order = (matched_positions[1:] < matched_positions[:-1]) & (
+                matched_files[1:] == matched_files[:-1]
+            )
+            failing[matched_files[1:][out_of_order]] = True
+
+        # Levels: a matched header at another level than required
+        expected = self.expected_levels[matched_positions]
+        wrong_level = (expected >= 0) & (expected != matched_levels)
+        failing[matched_files[wrong_level]] = True
+
+        results = []
+        for index, headers in enumerate(header_lists):
+            if failing[index]:
+                results.append(self.header_validator.validate_headers(headers))
+            else:
+                results.append((True, ["All headers validated successfully"]))
+        return results
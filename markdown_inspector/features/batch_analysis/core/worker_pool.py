@@ -0,0 +1,313 @@
+"""
+Worker pool module for Markdown Inspector.
+Runs batch tasks in worker processes with a per-task time budget, recycles
+workers that ran too many tasks or grew too large, and sizes the pool to the
+observed memory pressure.
+"""
+
+import os
+import sys
+import time
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+COMPLETED = "completed"
+RAISED = "raised"
+TIMED_OUT = "timed_out"
+CRASHED = "crashed"
+
+# Status a worker reports once its handler is built and it can take tasks
+READY = "ready"
+
+# How often the available system memory is sampled, in seconds
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+
+def resident_memory() -> int:
+    """
+    Return the resident set size of the current process in bytes.
+
+    Returns:
+        Current RSS where the platform exposes it, otherwise the peak RSS,
+        or 0 if neither is available
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def available_memory() -> Optional[int]:
+    """
+    Return the memory available to new processes in bytes.
+
+    Returns:
+        Available memory, or None if the platform does not expose it
+    """
+    try:
+        with open("/proc/meminfo", "r") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _worker_main(connection, factory: Callable, factory_args: Tuple) -> None:
+    """
+    Serve tasks received over a pipe until told to stop.
+
+    The worker reports READY once the factory returns, or RAISED if it fails,
+    so that building the handler does not count against a task's time budget.
+
+    Args:
+        connection: Worker end of the pipe to the pool
+        factory: Callable building the task handler once per worker
+        factory_args: Arguments passed to the factory
+    """
+    try:
+        handler = factory(*factory_args)
+    except Exception as e:
+        connection.send((RAISED, str(e), resident_memory()))
+        return
+    connection.send((READY, None, resident_memory()))
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        try:
+            status, result = COMPLETED, handler(task)
+        except Exception as e:
+            status, result = RAISED, str(e)
+        connection.send((status, result, resident_memory()))
+
+
+class _Worker:
+    """A worker process and the pool's end of its pipe."""
+
+    def __init__(self, context, factory: Callable, factory_args: Tuple):
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(worker_connection, factory, factory_args),
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+        self.task: Any = None
+        self.deadline: Optional[float] = None
+        self.tasks_done = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, terminating it if it does not."""
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        """Terminate the worker immediately."""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+class WorkerPool:
+    """Process pool with per-task time budget, worker recycling and adaptive size."""
+
+    def __init__(
+        self,
+        factory: Callable,
+        factory_args: Tuple = (),
+        max_workers: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        max_tasks_per_worker: Optional[int] = 100,
+        max_worker_memory: Optional[int] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Picklable callable returning the task handler of a worker
+            factory_args: Arguments passed to the factory in each worker
+            max_workers: Upper bound on the number of workers (CPU count if None)
+            time_budget: Seconds a single task may run before its worker is killed
+            max_tasks_per_worker: Tasks after which a worker is replaced
+            max_worker_memory: RSS in bytes after which a worker is replaced
+        """
+        self.factory = factory
+        self.factory_args = factory_args
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.time_budget = time_budget
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_memory = max_worker_memory
+        self.context = multiprocessing.get_context()
+        self.peak_worker_memory = 0
+        self._target_workers = self.max_workers
+        self._memory_sampled_at: Optional[float] = None
+
+    def target_workers(self) -> int:
+        """
+        Compute how many workers the observed memory pressure allows.
+
+        Once the size of a worker is known, the pool only grows while half of
+        the available memory can hold another worker of that size.
+
+        Returns:
+            Number of workers between 1 and max_workers
+        """
+        now = time.monotonic()
+        if (
+            self._memory_sampled_at is not None
+            and now - self._memory_sampled_at < MEMORY_SAMPLE_INTERVAL
+        ):
+            return self._target_workers
+        self._memory_sampled_at = now
+
+        available = available_memory()
+        if available is None or not self.peak_worker_memory:
+            self._target_workers = self.max_workers
+        else:
+            affordable = available // (2 * self.peak_worker_memory)
+            self._target_workers = max(1, min(self.max_workers, affordable))
+        return self._target_workers
+
+    def _needs_recycling(self, worker: _Worker, worker_memory: int) -> bool:
+        """Check whether a worker reached its task or memory limit."""
+        if (
+            self.max_tasks_per_worker is not None
+            and worker.tasks_done >= self.max_tasks_per_worker
+        ):
+            return True
+        return (
+            self.max_worker_memory is not None
+            and worker_memory > self.max_worker_memory
+        )
+
+    def _started(
+        self,
+        worker: _Worker,
+        idle: List[_Worker],
+        pending: Deque[Any],
+        results: Dict[Any, Tuple[str, Any]],
+    ) -> None:
+        """
+        Handle the first message of a new worker.
+
+        A ready worker becomes idle. Every worker builds its handler the same
+        way, so if one fails to start, the pending tasks get its outcome
+        instead of starting more workers that would fail too.
+        """
+        try:
+            status, result, worker_memory = worker.connection.recv()
+        except (EOFError, OSError):
+            status, result, worker_memory = CRASHED, None, 0
+
+        if status == READY:
+            self.peak_worker_memory = max(self.peak_worker_memory, worker_memory)
+            idle.append(worker)
+            return
+
+        worker.kill()
+        while pending:
+            results[pending.popleft()] = (status, result)
+
+    def run(self, tasks: List[Any]) -> Dict[Any, Tuple[str, Any]]:
+        """
+        Run the handler over every task.
+
+        Args:
+            tasks: Picklable, hashable tasks passed to the workers' handler
+
+        Returns:
+            Dictionary mapping each task to a (status, result) tuple. The status
+            is COMPLETED with the handler's return value, RAISED with the
+            exception message, or TIMED_OUT or CRASHED with None. A task's
+            time budget starts once a ready worker receives it
+        """
+        pending: Deque[Any] = deque(tasks)
+        starting: Dict[Any, _Worker] = {}
+        idle: List[_Worker] = []
+        busy: Dict[Any, _Worker] = {}
+        results: Dict[Any, Tuple[str, Any]] = {}
+
+        try:
+            while pending or busy:
+                # Grow or shrink the pool to what memory pressure allows
+                target = self.target_workers()
+                while idle and len(idle) + len(busy) > target:
+                    idle.pop().stop()
+                while (
+                    len(idle) + len(starting) < len(pending)
+                    and len(idle) + len(starting) + len(busy) < target
+                ):
+                    worker = _Worker(self.context, self.factory, self.factory_args)
+                    starting[worker.connection] = worker
+
+                while pending and idle:
+                    worker = idle.pop()
+                    worker.task = pending.popleft()
+                    worker.connection.send(worker.task)
+                    if self.time_budget is not None:
+                        worker.deadline = time.monotonic() + self.time_budget
+                    busy[worker.connection] = worker
+
+                deadlines = [w.deadline for w in busy.values() if w.deadline]
+                timeout = None
+                if deadlines:
+                    timeout = max(0.0, min(deadlines) - time.monotonic())
+
+                for connection in wait(list(starting) + list(busy), timeout):
+                    if connection in starting:
+                        self._started(starting.pop(connection), idle, pending, results)
+                        continue
+
+                    worker = busy.pop(connection)
+                    try:
+                        status, result, worker_memory = connection.recv()
+                    except (EOFError, OSError):
+                        results[worker.task] = (CRASHED, None)
+                        worker.kill()
+                        continue
+
+                    results[worker.task] = (status, result)
+                    worker.tasks_done += 1
+                    self.peak_worker_memory = max(
+                        self.peak_worker_memory, worker_memory
+                    )
+                    if self._needs_recycling(worker, worker_memory):
+                        worker.stop()
+                    else:
+                        idle.append(worker)
+
+                now = time.monotonic()
+                for connection, worker in list(busy.items()):
+                    if worker.deadline is not None and now >= worker.deadline:
+                        del busy[connection]
+                        results[worker.task] = (TIMED_OUT, None)
+                        worker.kill()
+        finally:
+            for worker in list(starting.values()) + idle:
+                worker.stop()
+            for worker in busy.values():
+                worker.kill()
+
+        return results
@@ -0,0 +1,3 @@
+"""
+Tests for batch analysis feature.
+"""
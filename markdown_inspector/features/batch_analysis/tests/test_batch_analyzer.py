@@ -0,0 +1,292 @@
+"""
+Tests for the batch analyzer module.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from markdown_inspector.features.batch_analysis.core import vectorized
+from markdown_inspector.features.batch_analysis.core.batch_analyzer import (
+    STATUS_BUDGET_EXCEEDED,
+    STATUS_PASSED,
+    BatchAnalyzer,
+)
+from markdown_inspector.features.header_validation.core.plugin import (
+    HeaderValidationRule,
+)
+from markdown_inspector.features.rule_engine.core.plugin import (
+    INFO,
+    RulePlugin,
+    make_finding,
+)
+
+
+class TestBatchAnalyzer(unittest.TestCase):
+    """Test cases for the BatchAnalyzer."""
+
+    def setUp(self):
+        """Set up a configuration and markdown files in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "config.json")
+        with open(self.config_path, "w") as config_file:
+            json.dump(
+                {
+                    "headings": [
+                        {"title": "Test Document", "level": 1},
+                        {"title": "Section One", "level": 2},
+                    ]
+                },
+                config_file,
+            )
+        self.valid_content = "# Test Document\n\n## Section One\n"
+        self.batch_analyzer = BatchAnalyzer(self.config_path)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        """Helper to write a markdown file."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    @staticmethod
+    def _without_timings(report):
+        """Helper to drop the timings, which differ between runs, from a report."""
+        return {key: value for key, value in report.items() if key != "timings"}
+
+    def test_duplicates_are_validated_once(self):
+        """Test that identical files share a single validation."""
+        first = self._write("a.md", self.valid_content)
+        second = self._write("b.md", self.valid_content)
+        invalid = self._write("c.md", "# Test Document\n")
+
+        analyzer = self.batch_analyzer.analyzer
+        with patch.object(
+            analyzer, "inspect_file", wraps=analyzer.inspect_file
+        ) as inspect_file:
+            report = self.batch_analyzer.analyze_files([first, second, invalid])
+
+        self.assertEqual(inspect_file.call_count, 2)
+        self.assertFalse(report["success"])
+        self.assertEqual(list(report["results"]), [first, second, invalid])
+        self.assertTrue(report["results"][first]["success"])
+        self.assertTrue(report["results"][second]["success"])
+        self.assertIn(
+            "Missing header: 'Section One'", report["results"][invalid]["messages"]
+        )
+        self.assertEqual(report["duplicate_groups"], [[first, second]])
+
+    def test_duplicates_with_path_dependent_results(self):
+        """Test that results naming a file are not copied to identical files."""
+        first = os.path.join(self.temp_dir, "a.md")
+        second = os.path.join(self.temp_dir, "b.md")
+        for path in (first, second):
+            with open(path, "wb") as file:
+                file.write(b"# Test Document\n\n## Caf\xe9\n")
+        batch_analyzer = BatchAnalyzer(self.config_path, encoding_errors="strict")
+
+        report = batch_analyzer.analyze_files([first, second])
+
+        self.assertEqual(report["duplicate_groups"], [[first, second]])
+        for path in (first, second):
+            self.assertEqual(
+                report["results"][path]["messages"],
+                [
+                    f"Cannot decode {path} as utf-8: unexpected end of data "
+                    "at line 3, byte offset 23"
+                ],
+            )
+
+    def test_duplicates_with_path_dependent_rule(self):
+        """Test that a rule using the path runs for every identical file."""
+
+        class PathRule(RulePlugin):
+            name = "path"
+            uses_path = True
+
+            def finish(self, context):
+                return [make_finding(self.name, context.path, INFO)]
+
+        first = self._write("a.md", self.valid_content)
+        second = self._write("b.md", self.valid_content)
+        with patch(
+            "markdown_inspector.features.rule_engine.core.engine.discover_plugins",
+            return_value=[HeaderValidationRule, PathRule],
+        ):
+            batch_analyzer = BatchAnalyzer(self.config_path)
+
+        report = batch_analyzer.analyze_files([first, second])
+
+        self.assertEqual(report["duplicate_groups"], [[first, second]])
+        self.assertIn(first, report["results"][first]["messages"])
+        self.assertIn(second, report["results"][second]["messages"])
+
+    def test_missing_file(self):
+        """Test that a missing file is reported as a failed result."""
+        valid = self._write("a.md", self.valid_content)
+        missing = os.path.join(self.temp_dir, "missing.md")
+
+        report = self.batch_analyzer.analyze_files([valid, missing])
+
+        self.assertFalse(report["success"])
+        self.assertEqual(
+            report["results"][missing]["messages"],
+            [f"Markdown file not found: {missing}"],
+        )
+        self.assertEqual(report["duplicate_groups"], [])
+
+    def test_analysis_errors_are_isolated(self):
+        """Test that an error in one file does not stop the other files."""
+        valid = self._write("a.md", self.valid_content)
+        broken = self._write("b.md", "# Broken\n")
+        inspect_file = self.batch_analyzer.analyzer.inspect_file
+
+        def inspect(path):
+            if path == broken:
+                raise RuntimeError("rule crashed")
+            return inspect_file(path)
+
+        with patch.object(self.batch_analyzer.analyzer, "inspect_file", inspect):
+            report = self.batch_analyzer.analyze_files([valid, broken])
+
+        self.assertFalse(report["success"])
+        self.assertTrue(report["results"][valid]["success"])
+        self.assertEqual(
+            report["results"][broken]["messages"], ["Analysis error: rule crashed"]
+        )
+
+    def test_size_budget(self):
+        """Test that files over the size budget get a distinct result."""
+        valid = self._write("a.md", self.valid_content)
+        large = self._write("b.md", self.valid_content + "x" * 100)
+        batch_analyzer = BatchAnalyzer(self.config_path, size_budget=50)
+
+        report = batch_analyzer.analyze_files([valid, large])
+
+        self.assertFalse(report["success"])
+        self.assertEqual(report["results"][valid]["status"], STATUS_PASSED)
+        self.assertEqual(report["results"][large]["status"], STATUS_BUDGET_EXCEEDED)
+
+    def test_worker_pool_matches_serial(self):
+        """Test that analysis in worker processes gives the serial results."""
+        paths = [
+            self._write("a.md", self.valid_content),
+            self._write("b.md", "# Test Document\n"),
+            self._write("c.md", self.valid_content),
+        ]
+        batch_analyzer = BatchAnalyzer(self.config_path, jobs=2, time_budget=10)
+
+        self.assertEqual(
+            self._without_timings(batch_analyzer.analyze_files(paths)),
+            self._without_timings(self.batch_analyzer.analyze_files(paths)),
+        )
+
+    @unittest.skipIf(vectorized.np is None, "numpy is not installed")
+    def test_vectorized_engine_matches_scalar(self):
+        """Test that the vectorized engine gives the scalar results."""
+        paths = [
+            self._write("a.md", self.valid_content),
+            self._write("b.md", "## Section One\n# Test Document\n"),
+            self._write("c.md", self.valid_content),
+            os.path.join(self.temp_dir, "missing.md"),
+        ]
+
+        for jobs in (None, 2):
+            batch_analyzer = BatchAnalyzer(
+                self.config_path, jobs=jobs, engine="vectorized"
+            )
+            self.assertIsNotNone(batch_analyzer.vectorized_validator)
+            self.assertEqual(
+                self._without_timings(batch_analyzer.analyze_files(paths)),
+                self._without_timings(self.batch_analyzer.analyze_files(paths)),
+            )
+
+    @unittest.skipIf(vectorized.np is None, "numpy is not installed")
+    def test_vectorized_engine_reports_unreadable_files(self):
+        """Test that undecodable and unreadable files fail alone in both engines."""
+        valid = self._write("a.md", self.valid_content)
+        undecodable = os.path.join(self.temp_dir, "b.md")
+        with open(undecodable, "wb") as file:
+            file.write(b"# Test Document\n\n## Section \xff\n")
+        directory = os.path.join(self.temp_dir, "dir.md")
+        os.mkdir(directory)
+        paths = [valid, undecodable, directory]
+
+        scalar = BatchAnalyzer(self.config_path, encoding_errors="strict")
+        expected = self._without_timings(scalar.analyze_files(paths))
+        self.assertTrue(expected["results"][valid]["success"])
+        self.assertTrue(
+            expected["results"][undecodable]["messages"][0].startswith(
+                f"Cannot decode {undecodable} as utf-8: "
+            )
+        )
+        self.assertTrue(
+            expected["results"][directory]["messages"][0].startswith(
+                f"Cannot read {directory}: "
+            )
+        )
+
+        for jobs in (None, 2):
+            batch_analyzer = BatchAnalyzer(
+                self.config_path,
+                jobs=jobs,
+                engine="vectorized",
+                encoding_errors="strict",
+            )
+            self.assertEqual(
+                self._without_timings(batch_analyzer.analyze_files(paths)), expected
+            )
+
+    def test_timings_are_summed(self):
+        """Test that rule timings are summed over the files actually analyzed."""
+        paths = [
+            self._write("a.md", self.valid_content),
+            self._write("b.md", self.valid_content),
+            self._write("c.md", "# Test Document\n"),
+        ]
+        result = {"success": True, "findings": [], "timings": {"tokenize": 0.25}}
+
+        with patch.object(
+            self.batch_analyzer.analyzer, "inspect_file", return_value=result
+        ):
+            report = self.batch_analyzer.analyze_files(paths)
+        self.assertEqual(report["timings"], {"tokenize": 0.5})
+
+        pooled = BatchAnalyzer(self.config_path, jobs=2).analyze_files(paths)
+        self.assertEqual(
+            set(pooled["timings"]), {HeaderValidationRule.name, "tokenize"}
+        )
+
+    def test_toc_rule_in_batch(self):
+        """Test that the table of contents rule runs in batch mode."""
+        with open(self.config_path, "w") as config_file:
+            json.dump(
+                {"headings": [{"title": "Test Document", "level": 1}], "toc": True},
+                config_file,
+            )
+        path = self._write(
+            "toc.md",
+            "# Test Document\n## Table of Contents\n- [Gone](#gone)\n",
+        )
+
+        # The vectorized engine only validates headers, so it is not used
+        batch_analyzer = BatchAnalyzer(self.config_path, engine="vectorized")
+        self.assertIsNone(batch_analyzer.vectorized_validator)
+
+        result = batch_analyzer.analyze_files([path])["results"][path]
+        self.assertFalse(result["success"])
+        self.assertIn(
+            "Table of contents entry 'Gone' links to a missing heading '#gone'",
+            result["messages"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the batch runner module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from markdown_inspector.features.batch_analysis.core.batch_runner import BatchRunner
+from markdown_inspector.features.batch_analysis.core.worker_pool import (
+    COMPLETED,
+    RAISED,
+)
+
+
+def _file_size(path):
+    """Handler used by the test runs."""
+    if path.endswith("bad.md"):
+        raise ValueError("bad file")
+    return os.path.getsize(path)
+
+
+def _create_handler():
+    """Factory used by the test runs."""
+    return _file_size
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test cases for the BatchRunner."""
+
+    def setUp(self):
+        """Set up markdown files in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for name, size in (("a.md", 10), ("bad.md", 20), ("c.md", 100)):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, "w") as file:
+                file.write("x" * size)
+            self.paths.append(path)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_uses_pool(self):
+        """Test that a pool is used for several jobs or a time budget."""
+        self.assertFalse(BatchRunner().uses_pool())
+        self.assertFalse(BatchRunner(jobs=1).uses_pool())
+        self.assertTrue(BatchRunner(jobs=2).uses_pool())
+        self.assertTrue(BatchRunner(time_budget=1).uses_pool())
+
+    def test_split_by_size(self):
+        """Test that files over the size budget are set aside."""
+        missing = os.path.join(self.temp_dir, "missing.md")
+        runner = BatchRunner(size_budget=50)
+
+        within_budget, oversized = runner.split_by_size(self.paths + [missing])
+
+        self.assertEqual(within_budget, self.paths[:2] + [missing])
+        self.assertEqual(
+            oversized,
+            {
+                self.paths[2]: "File size of 100 bytes exceeds the size budget "
+                "of 50 bytes"
+            },
+        )
+        self.assertEqual(BatchRunner().split_by_size(self.paths), (self.paths, {}))
+
+    def test_run_in_process_and_pool(self):
+        """Test that both ways of running keep errors per file."""
+        expected = {
+            self.paths[0]: (COMPLETED, 10),
+            self.paths[1]: (RAISED, "bad file"),
+            self.paths[2]: (COMPLETED, 100),
+        }
+
+        for runner in (BatchRunner(), BatchRunner(jobs=2)):
+            self.assertEqual(runner.run(self.paths, _create_handler), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for the content deduplicator module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from markdown_inspector.features.batch_analysis.core.deduplicator import (
+    ContentDeduplicator,
+)
+
+
+class TestContentDeduplicator(unittest.TestCase):
+    """Test cases for the ContentDeduplicator."""
+
+    def setUp(self):
+        """Set up a temporary directory for test files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.deduplicator = ContentDeduplicator(chunk_size=4)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        """Helper to write a test file."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_identical_files_are_grouped(self):
+        """Test that byte-identical files end up in one group."""
+        first = self._write("a.md", "# Title\n")
+        second = self._write("b.md", "# Other\n")
+        third = self._write("c.md", "# Title\n")
+
+        groups = self.deduplicator.group_identical([first, second, third])
+
+        self.assertEqual(groups, [[first, third], [second]])
+
+    def test_same_size_different_content(self):
+        """Test that files with equal size but different content stay apart."""
+        first = self._write("a.md", "# One\n")
+        second = self._write("b.md", "# Two\n")
+
+        groups = self.deduplicator.group_identical([first, second])
+
+        self.assertEqual(groups, [[first], [second]])
+
+    def test_missing_and_repeated_paths(self):
+        """Test that missing files form their own group and repeats are ignored."""
+        existing = self._write("a.md", "# Title\n")
+        missing = os.path.join(self.temp_dir, "missing.md")
+
+        groups = self.deduplicator.group_identical([missing, existing, existing])
+
+        self.assertEqual(groups, [[missing], [existing]])
+
+
+if __name__ == "__main__":
+    unittest.main()
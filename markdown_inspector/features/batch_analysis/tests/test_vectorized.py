@@ -0,0 +1,66 @@
+"""
+Tests for the vectorized validation module.
+"""
+
+import unittest
+
+from markdown_inspector.features.batch_analysis.core import vectorized
+from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+
+
+@unittest.skipIf(vectorized.np is None, "numpy is not installed")
+class TestVectorizedValidator(unittest.TestCase):
+    """Test cases for the VectorizedValidator."""
+
+    def setUp(self):
+        """Set up a validator and a corpus covering every kind of failure."""
+        self.header_validator = HeaderValidator(
+            {
+                "headings": [
+                    {"title": "Document", "level": 1},
+                    {"titles": ["Setup", "Installation"], "level": 2},
+                    {"glob": "Release *", "level": 2},
+                    {"title": "Appendix"},
+                ]
+            }
+        )
+        self.validator = vectorized.VectorizedValidator(self.header_validator)
+        self.documents = [
+            "# Document\n## Setup\n## Extra\n## Release 1.0\n### Appendix\n",
+            "# Document\n## Installation\n",
+            "# Document\n## Release 2\n## Setup\n# Appendix\n",
+            "## Document\n## Setup\n### Release 3\n## Appendix\n",
+            "",
+            "# Document\n## Setup\n## Release 4\n## Appendix\n",
+        ]
+
+    def test_matches_scalar_validation(self):
+        """Test that the results are identical to the scalar validator."""
+        header_lists = [
+            self.header_validator.parse_markdown_headers(document)
+            for document in self.documents
+        ]
+
+        expected = [
+            self.header_validator.validate_headers(headers) for headers in header_lists
+        ]
+        self.assertEqual(self.validator.validate_corpus(header_lists), expected)
+        self.assertEqual(
+            [success for success, _ in expected],
+            [True, False, False, False, False, True],
+        )
+
+    def test_empty_corpus(self):
+        """Test validating no files at all."""
+        self.assertEqual(self.validator.validate_corpus([]), [])
+
+    def test_supports(self):
+        """Test that nested section requirements are not vectorized."""
+        self.assertTrue(vectorized.VectorizedValidator.supports({"headings": []}))
+        self.assertFalse(
+            vectorized.VectorizedValidator.supports({"headings": [], "sections": []})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for the worker pool module.
+"""
+
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+from markdown_inspector.features.batch_analysis.core import worker_pool
+from markdown_inspector.features.batch_analysis.core.worker_pool import (
+    COMPLETED,
+    RAISED,
+    TIMED_OUT,
+    WorkerPool,
+)
+
+
+def _run_task(task):
+    """Handler used by the test workers."""
+    if task == "hang":
+        time.sleep(30)
+    if task == "raise":
+        raise ValueError("bad task")
+    return os.getpid()
+
+
+def _create_handler():
+    """Factory used by the test workers."""
+    return _run_task
+
+
+def _run_timed_task(task):
+    """Handler reporting when it ran, to check how many tasks ran at once."""
+    start = time.monotonic()
+    time.sleep(0.05)
+    return start, time.monotonic()
+
+
+def _create_timed_handler():
+    """Factory of the timed handler."""
+    return _run_timed_task
+
+
+def _create_slow_handler(delay):
+    """Factory that takes a while to build the handler."""
+    time.sleep(delay)
+    return _run_task
+
+
+def _create_broken_handler():
+    """Factory that fails in every worker."""
+    raise ValueError("bad config")
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for the WorkerPool."""
+
+    def test_runs_all_tasks(self):
+        """Test that every task gets a completed result."""
+        pool = WorkerPool(_create_handler, max_workers=2)
+        results = pool.run(["a", "b", "c"])
+
+        self.assertEqual(set(results), {"a", "b", "c"})
+        self.assertTrue(all(status == COMPLETED for status, _ in results.values()))
+
+    def test_workers_are_recycled(self):
+        """Test that a worker is replaced after its task limit."""
+        pool = WorkerPool(_create_handler, max_workers=1, max_tasks_per_worker=1)
+        results = pool.run(["a", "b", "c"])
+
+        pids = {pid for _, pid in results.values()}
+        self.assertEqual(len(pids), 3)
+
+    def test_time_budget(self):
+        """Test that a hanging task is cut off without losing the others."""
+        pool = WorkerPool(_create_handler, max_workers=2, time_budget=0.5)
+
+        start = time.monotonic()
+        results = pool.run(["hang", "a", "b"])
+
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(results["hang"], (TIMED_OUT, None))
+        self.assertEqual(results["a"][0], COMPLETED)
+        self.assertEqual(results["b"][0], COMPLETED)
+
+    def test_startup_is_not_charged_to_tasks(self):
+        """Test that a slow factory does not use up the first task's time budget."""
+        pool = WorkerPool(
+            _create_slow_handler,
+            (0.6,),
+            max_workers=2,
+            time_budget=0.3,
+            max_tasks_per_worker=1,
+        )
+        results = pool.run(["a", "b", "c"])
+
+        self.assertTrue(all(status == COMPLETED for status, _ in results.values()))
+
+    def test_factory_error(self):
+        """Test that a factory failing in the workers fails every task."""
+        pool = WorkerPool(_create_broken_handler, max_workers=2)
+        results = pool.run(["a", "b", "c"])
+
+        self.assertEqual(results, {task: (RAISED, "bad config") for task in "abc"})
+
+    def test_memory_recycling(self):
+        """Test that a worker over the memory limit is replaced."""
+        if not worker_pool.resident_memory():
+            self.skipTest("resident memory is not available")
+
+        pool = WorkerPool(_create_handler, max_workers=1, max_worker_memory=1)
+        results = pool.run(["a", "b", "c"])
+        self.assertEqual(len({pid for _, pid in results.values()}), 3)
+
+        pool = WorkerPool(_create_handler, max_workers=1, max_worker_memory=2**40)
+        results = pool.run(["a", "b", "c"])
+        self.assertEqual(len({pid for _, pid in results.values()}), 1)
+
+    def test_pool_shrinks_under_memory_pressure(self):
+        """Test that the pool stops growing when memory for a worker runs out."""
+        pool = WorkerPool(_create_timed_handler, max_workers=4)
+        self.assertEqual(pool.target_workers(), 4)
+
+        with patch.object(worker_pool, "MEMORY_SAMPLE_INTERVAL", 0), patch.object(
+            worker_pool, "available_memory", return_value=1
+        ):
+            results = pool.run(["a", "b", "c", "d", "e", "f"])
+            self.assertEqual(pool.target_workers(), 1)
+
+        # Once a worker's size is known, tasks no longer run in parallel
+        self.assertTrue(all(status == COMPLETED for status, _ in results.values()))
+        spans = sorted(span for _, span in results.values())
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            self.assertLessEqual(end, start)
+        self.assertGreater(pool.peak_worker_memory, 0)
+
+        # Without a known worker size the pool uses every worker it may
+        pool.peak_worker_memory = 0
+        with patch.object(worker_pool, "MEMORY_SAMPLE_INTERVAL", 0):
+            self.assertEqual(pool.target_workers(), 4)
+
+    def test_handler_error(self):
+        """Test that an exception in the handler is reported for its task."""
+        pool = WorkerPool(_create_handler, max_workers=1)
+        results = pool.run(["raise", "a"])
+
+        self.assertEqual(results["raise"], (RAISED, "bad task"))
+        self.assertEqual(results["a"][0], COMPLETED)
+
+
+if __name__ == "__main__":
+    unittest.main()
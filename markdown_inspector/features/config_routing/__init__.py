@@ -0,0 +1,14 @@
+"""
+Config routing feature for markdown files.
+"""
+
+from markdown_inspector.features.config_routing.core.router import ConfigRouter
+from markdown_inspector.features.config_routing.core.routed_analyzer import (
+    RoutedAnalyzer,
+)
+from markdown_inspector.features.config_routing.core.routed_fixer import RoutedFixer
+from markdown_inspector.features.config_routing.core.front_matter import (
+    read_front_matter,
+)
+
+__all__ = ["ConfigRouter", "RoutedAnalyzer", "RoutedFixer", "read_front_matter"]
@@ -0,0 +1,68 @@
+"""
+Front matter module for Markdown Inspector.
+Reads the leading YAML front matter block of a markdown file.
+"""
+
+from typing import Dict, Optional
+from markdown_inspector.features.rule_engine.core.tokenizer import (
+    is_front_matter_line,
+    parse_front_matter_line,
+)
+
+# Front matter larger than this is not considered for routing
+DEFAULT_MAX_BYTES = 64 * 1024
+
+
+def _strip_line(line: bytes) -> bytes:
+    """Remove the line ending and trailing whitespace of a raw line."""
+    return line.rstrip(b"\r\n").rstrip()
+
+
+def read_front_matter(
+    markdown_path: str, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Optional[Dict[str, str]]:
+    """
+    Read the top-level scalar keys of a file's front matter.
+
+    Only the leading block delimited by "---" lines is read, and reading stops
+    after max_bytes, so the cost does not depend on the size of the file.
+    Nested values, lists and comments are skipped.
+
+    Args:
+        markdown_path: Path to the markdown file
+        max_bytes: Maximum number of bytes to read from the start of the file
+
+    Returns:
+        Dictionary of front matter keys and values, or None if the file has
+        no complete front matter block within max_bytes, or starts with a
+        thematic break instead
+
+    Raises:
+        FileNotFoundError: If the markdown file doesn't exist
+    """
+    with open(markdown_path, "rb") as md_file:
+        first_line = md_file.readline(max_bytes)
+        if _strip_line(first_line).lstrip(b"\xef\xbb\xbf") != b"---":
+            return None
+
+        values: Dict[str, str] = {}
+        previous_line = ""
+        remaining = max_bytes - len(first_line)
+        while remaining > 0:
+            line = md_file.readline(remaining)
+            if not line:
+                return None
+            remaining -= len(line)
+
+            stripped = _strip_line(line)
+            if stripped in (b"---", b"..."):
+                return values
+            text = stripped.decode("utf-8", "replace")
+            if not is_front_matter_line(text, previous_line):
+                return None
+            previous_line = text
+            entry = parse_front_matter_line(text)
+            if entry is not None:
+                values[entry[0]] = entry[1]
+
+    return None
@@ -0,0 +1,79 @@
+"""
+Routed analysis module for Markdown Inspector.
+Analyzes markdown files against the configuration chosen for each of them.
+"""
+
+from typing import Any, Dict, List
+from markdown_inspector.features.batch_analysis.core.batch_analyzer import (
+    STATUS_FAILED,
+    BatchAnalyzer,
+)
+from markdown_inspector.features.config_routing.core.router import ConfigRouter
+
+
+class RoutedAnalyzer:
+    """Groups files by their routed configuration and analyzes each group."""
+
+    def __init__(self, router: ConfigRouter, **batch_options: Any):
+        """
+        Initialize the routed analyzer.
+
+        Args:
+            router: Router choosing the configuration of each file
+            **batch_options: Options passed to every BatchAnalyzer
+        """
+        self.router = router
+        self.batch_options = batch_options
+        self.batch_analyzers: Dict[str, BatchAnalyzer] = {}
+
+    def _batch_analyzer(self, config_path: str) -> BatchAnalyzer:
+        """Return the batch analyzer of a configuration, creating it once."""
+        if config_path not in self.batch_analyzers:
+            self.batch_analyzers[config_path] = BatchAnalyzer(
+                config_path, **self.batch_options
+            )
+        return self.batch_analyzers[config_path]
+
+    def analyze_files(self, markdown_paths: List[str]) -> Dict[str, Any]:
+        """
+        Analyze markdown files against their routed configurations.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+
+        Returns:
+            Batch report as returned by BatchAnalyzer.analyze_files, where each
+            result also names the configuration it was validated against
+        """
+        duplicate_groups: List[List[str]] = []
+        timings: Dict[str, float] = {}
+
+        def analyze_group(
+            config_path: str, paths: List[str]
+        ) -> Dict[str, Dict[str, Any]]:
+            report = self._batch_analyzer(config_path).analyze_files(paths)
+            duplicate_groups.extend(report["duplicate_groups"])
+            for rule, seconds in report["timings"].items():
+                timings[rule] = timings.get(rule, 0.0) + seconds
+            return {
+                path: dict(result, config=config_path)
+                for path, result in report["results"].items()
+            }
+
+        def unmatched_result(message: str) -> Dict[str, Any]:
+            return {
+                "success": False,
+                "status": STATUS_FAILED,
+                "messages": [message],
+                "config": None,
+            }
+
+        results = self.router.run_groups(
+            markdown_paths, analyze_group, unmatched_result
+        )
+        return {
+            "success": all(result["success"] for result in results.values()),
+            "results": results,
+            "duplicate_groups": duplicate_groups,
+            "timings": timings,
+        }
@@ -0,0 +1,51 @@
+"""
+Routed fixing module for Markdown Inspector.
+Fixes markdown files against the configuration chosen for each of them.
+"""
+
+from typing import Any, Dict, List
+from markdown_inspector.features.autofix.core.batch_fixer import BatchFixer
+from markdown_inspector.features.config_routing.core.router import ConfigRouter
+
+
+class RoutedFixer:
+    """Groups files by their routed configuration and fixes each group."""
+
+    def __init__(self, router: ConfigRouter, **batch_options: Any):
+        """
+        Initialize the routed fixer.
+
+        Args:
+            router: Router choosing the configuration of each file
+            **batch_options: Options passed to every BatchFixer
+        """
+        self.router = router
+        self.batch_options = batch_options
+
+    def fix_files(
+        self, markdown_paths: List[str], dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fix markdown files against their routed configurations.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+            dry_run: Report the changes as unified diffs instead of writing them
+
+        Returns:
+            Fix report as returned by BatchFixer.fix_files, with the results
+            of all configurations
+        """
+
+        def fix_group(config_path: str, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+            batch_fixer = BatchFixer(config_path, **self.batch_options)
+            return batch_fixer.fix_files(paths, dry_run)["results"]
+
+        def unmatched_result(message: str) -> Dict[str, Any]:
+            return {"changed": False, "fixes": [], "error": message}
+
+        results = self.router.run_groups(markdown_paths, fix_group, unmatched_result)
+        return {
+            "success": not any("error" in result for result in results.values()),
+            "results": results,
+        }
@@ -0,0 +1,189 @@
+"""
+Config router module for Markdown Inspector.
+Chooses the configuration of each markdown file from its front matter.
+"""
+
+import os
+import glob
+import json
+import fnmatch
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from markdown_inspector.features.config_routing.core.front_matter import (
+    read_front_matter,
+)
+
+# Configuration files in a config directory are named <doc-type>-docs-req.json
+CONFIG_SUFFIX = "-docs-req.json"
+
+
+class ConfigRouter:
+    """Routes markdown files to configuration files."""
+
+    def __init__(
+        self,
+        doc_types: Dict[str, str],
+        globs: Optional[List[Tuple[str, str]]] = None,
+        default: Optional[str] = None,
+        key: str = "doc-type",
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            doc_types: Map of front matter document types to configuration paths
+            globs: (pattern, configuration path) rules for files whose front
+                matter does not name a known document type, tried in order
+            default: Configuration path for files matching no other rule
+            key: Front matter key holding the document type
+        """
+        self.doc_types = doc_types
+        self.globs = globs or []
+        self.default = default
+        self.key = key
+
+    @classmethod
+    def from_config_dir(
+        cls, config_dir: str, default: Optional[str] = None
+    ) -> "ConfigRouter":
+        """
+        Build a router from the configuration files in a directory.
+
+        A file named "operations-docs-req.json" handles documents whose front
+        matter declares "doc-type: operations".
+
+        Args:
+            config_dir: Directory containing *-docs-req.json files
+            default: Configuration path for files without a known document type
+
+        Returns:
+            The router
+
+        Raises:
+            FileNotFoundError: If the directory doesn't exist
+        """
+        if not os.path.isdir(config_dir):
+            raise FileNotFoundError(f"Configuration directory not found: {config_dir}")
+
+        doc_types = {}
+        for path in sorted(glob.glob(os.path.join(config_dir, "*" + CONFIG_SUFFIX))):
+            doc_types[os.path.basename(path)[: -len(CONFIG_SUFFIX)]] = path
+        return cls(doc_types, default=default)
+
+    @classmethod
+    def load(cls, routing_path: str) -> "ConfigRouter":
+        """
+        Load a router from a JSON routing file.
+
+        The file may hold "key" (default "doc-type"), a "doc_types" map, a
+        "globs" list of {"pattern", "config"} rules and a "default" config.
+        Relative configuration paths are resolved against the routing file.
+
+        Args:
+            routing_path: Path to the routing file
+
+        Returns:
+            The router
+
+        Raises:
+            ValueError: If the routing file contains invalid JSON
+            FileNotFoundError: If the routing file doesn't exist
+        """
+        try:
+            with open(routing_path, "r") as routing_file:
+                routing = json.load(routing_file)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in routing file: {routing_path}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Routing file not found: {routing_path}")
+
+        base_dir = os.path.dirname(os.path.abspath(routing_path))
+
+        def resolve(path: Optional[str]) -> Optional[str]:
+            return None if path is None else os.path.join(base_dir, path)
+
+        return cls(
+            {
+                doc_type: resolve(path)
+                for doc_type, path in routing.get("doc_types", {}).items()
+            },
+            globs=[
+                (rule["pattern"], resolve(rule["config"]))
+                for rule in routing.get("globs", [])
+            ],
+            default=resolve(routing.get("default")),
+            key=routing.get("key", "doc-type"),
+        )
+
+    def route(self, markdown_path: str) -> Optional[str]:
+        """
+        Choose the configuration of a markdown file.
+
+        Only the front matter at the start of the file is read.
+
+        Args:
+            markdown_path: Path to the markdown file
+
+        Returns:
+            Path to the configuration file, or None if no rule applies
+        """
+        try:
+            front_matter = read_front_matter(markdown_path)
+        except OSError:
+            front_matter = None
+
+        if front_matter is not None:
+            config_path = self.doc_types.get(front_matter.get(self.key))
+            if config_path is not None:
+                return config_path
+
+        normalized_path = markdown_path.replace(os.sep, "/")
+        for pattern, config_path in self.globs:
+            if fnmatch.fnmatch(normalized_path, pattern):
+                return config_path
+        return self.default
+
+    def group(self, markdown_paths: List[str]) -> Dict[Optional[str], List[str]]:
+        """
+        Group markdown files by their configuration.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+
+        Returns:
+            Dictionary mapping configuration paths, or None for files no rule
+            applies to, to the files using them
+        """
+        groups: Dict[Optional[str], List[str]] = {}
+        for path in markdown_paths:
+            groups.setdefault(self.route(path), []).append(path)
+        return groups
+
+    def run_groups(
+        self,
+        markdown_paths: List[str],
+        run_group: Callable[[str, List[str]], Dict[str, Dict[str, Any]]],
+        unmatched_result: Callable[[str], Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run a batch over the files of each configuration.
+
+        Args:
+            markdown_paths: Paths to the markdown files
+            run_group: Callable taking a configuration path and its files and
+                returning the result of each file keyed by path
+            unmatched_result: Callable building the result of a file no rule
+                applies to from its "No configuration matches" message
+
+        Returns:
+            The result of each file keyed by path, in the order of
+            markdown_paths without repeated paths
+        """
+        unique_paths = list(dict.fromkeys(markdown_paths))
+        results: Dict[str, Dict[str, Any]] = {}
+        for config_path, paths in self.group(unique_paths).items():
+            if config_path is None:
+                for path in paths:
+                    results[path] = unmatched_result(f"No configuration matches {path}")
+            else:
+                results.update(run_group(config_path, paths))
+        return {path: results[path] for path in unique_paths}
@@ -0,0 +1,3 @@
+"""
+Tests for config routing feature.
+"""
@@ -0,0 +1,55 @@
+"""
+Tests for the front matter module.
+"""
+
+import os
+import tempfile
+import unittest
+
+from markdown_inspector.features.config_routing.core.front_matter import (
+    read_front_matter,
+)
+
+
+class TestFrontMatter(unittest.TestCase):
+    """Test cases for reading front matter."""
+
+    def _write(self, content):
+        """Helper to write a temporary markdown file."""
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".md", delete=False
+        ) as temp_file:
+            temp_file.write(content)
+        self.addCleanup(os.unlink, temp_file.name)
+        return temp_file.name
+
+    def test_reads_scalar_keys(self):
+        """Test reading top-level keys with CRLF line endings and a BOM."""
+        path = self._write(
+            b"\xef\xbb\xbf---\r\ndoc-type: operations\r\ntitle: 'Runbook'\r\n"
+            b"tags:\r\n  - ops\r\n---\r\n# Runbook\r\n"
+        )
+
+        self.assertEqual(
+            read_front_matter(path),
+            {"doc-type": "operations", "title": "Runbook", "tags": ""},
+        )
+
+    def test_no_front_matter(self):
+        """Test files without a front matter block."""
+        self.assertIsNone(read_front_matter(self._write(b"# Title\n---\n")))
+        self.assertIsNone(read_front_matter(self._write(b"")))
+        self.assertIsNone(
+            read_front_matter(self._write(b"---\n# Doc\n\nNote: text\n---\n"))
+        )
+
+    def test_bounded_read(self):
+        """Test that a block not closed within the byte limit is ignored."""
+        path = self._write(b"---\ndoc-type: user\n" + b"x: y\n" * 100 + b"---\n")
+
+        self.assertIsNone(read_front_matter(path, max_bytes=100))
+        self.assertEqual(read_front_matter(path)["doc-type"], "user")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for the config router and routed analyzer modules.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from markdown_inspector.features.config_routing.core.router import ConfigRouter
+from markdown_inspector.features.config_routing.core.routed_analyzer import (
+    RoutedAnalyzer,
+)
+from markdown_inspector.features.config_routing.core.routed_fixer import RoutedFixer
+
+
+class TestConfigRouter(unittest.TestCase):
+    """Test cases for the ConfigRouter, RoutedAnalyzer and RoutedFixer."""
+
+    def setUp(self):
+        """Set up a config directory and markdown files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = os.path.join(self.temp_dir, "config")
+        os.mkdir(self.config_dir)
+        for doc_type in ("user", "operations"):
+            with open(
+                os.path.join(self.config_dir, f"{doc_type}-docs-req.json"), "w"
+            ) as config_file:
+                json.dump(
+                    {"headings": [{"title": f"{doc_type} guide", "level": 1}]},
+                    config_file,
+                )
+        self.user_config = os.path.join(self.config_dir, "user-docs-req.json")
+        self.operations_config = os.path.join(
+            self.config_dir, "operations-docs-req.json"
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        """Helper to write a markdown file."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_routes_by_doc_type(self):
+        """Test routing on the front matter document type."""
+        router = ConfigRouter.from_config_dir(self.config_dir)
+        operations = self._write("ops.md", "---\ndoc-type: operations\n---\n")
+        unknown = self._write("other.md", "---\ndoc-type: legal\n---\n")
+        plain = self._write("plain.md", "# user guide\n")
+
+        self.assertEqual(router.route(operations), self.operations_config)
+        self.assertIsNone(router.route(unknown))
+        self.assertIsNone(router.route(plain))
+
+        router.default = self.user_config
+        self.assertEqual(router.route(plain), self.user_config)
+
+    def test_routing_file(self):
+        """Test a routing file with glob fallbacks and relative paths."""
+        routing_path = os.path.join(self.temp_dir, "routing.json")
+        with open(routing_path, "w") as routing_file:
+            json.dump(
+                {
+                    "key": "kind",
+                    "doc_types": {"ops": "config/operations-docs-req.json"},
+                    "globs": [
+                        {
+                            "pattern": "*/runbook-*.md",
+                            "config": "config/operations-docs-req.json",
+                        }
+                    ],
+                    "default": "config/user-docs-req.json",
+                },
+                routing_file,
+            )
+        router = ConfigRouter.load(routing_path)
+
+        kind = self._write("a.md", "---\nkind: ops\n---\n")
+        runbook = self._write("runbook-db.md", "# Runbook\n")
+        other = self._write("b.md", "# Guide\n")
+
+        self.assertEqual(os.path.abspath(router.route(kind)), self.operations_config)
+        self.assertEqual(os.path.abspath(router.route(runbook)), self.operations_config)
+        self.assertEqual(os.path.abspath(router.route(other)), self.user_config)
+
+    def test_routed_analysis(self):
+        """Test that each file is validated against its routed config."""
+        router = ConfigRouter.from_config_dir(self.config_dir)
+        user = self._write("user.md", "---\ndoc-type: user\n---\n# user guide\n")
+        operations = self._write(
+            "ops.md", "---\ndoc-type: operations\n---\n# user guide\n"
+        )
+        plain = self._write("plain.md", "# user guide\n")
+
+        analyzer = RoutedAnalyzer(router)
+        report = analyzer.analyze_files([user, operations, plain])
+
+        self.assertFalse(report["success"])
+        self.assertEqual(list(report["results"]), [user, operations, plain])
+        self.assertTrue(report["results"][user]["success"])
+        self.assertEqual(report["results"][user]["config"], self.user_config)
+        self.assertIn(
+            "Missing header: 'operations guide'",
+            report["results"][operations]["messages"],
+        )
+        self.assertEqual(
+            report["results"][plain]["messages"], [f"No configuration matches {plain}"]
+        )
+        self.assertEqual(len(analyzer.batch_analyzers), 2)
+
+    def test_routed_fixing(self):
+        """Test that each file is fixed against its routed config with the budgets."""
+        router = ConfigRouter.from_config_dir(self.config_dir)
+        user = self._write("user.md", "---\ndoc-type: user\n---\n## User Guide\n")
+        large = self._write(
+            "large.md", "---\ndoc-type: user\n---\n## User Guide\n" + "x" * 100
+        )
+        plain = self._write("plain.md", "## user guide\n")
+
+        report = RoutedFixer(router, size_budget=100).fix_files(
+            [user, large, plain, user]
+        )
+
+        self.assertFalse(report["success"])
+        self.assertEqual(list(report["results"]), [user, large, plain])
+        self.assertTrue(report["results"][user]["changed"])
+        self.assertIn("exceeds the size budget", report["results"][large]["error"])
+        self.assertEqual(
+            report["results"][plain]["error"], f"No configuration matches {plain}"
+        )
+        with open(user, "r") as file:
+            self.assertEqual(file.read(), "---\ndoc-type: user\n---\n# user guide\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
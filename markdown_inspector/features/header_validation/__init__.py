@@ -6,5 +6,6 @@ from markdown_inspector.features.header_validation.core.validator import HeaderV
 from markdown_inspector.features.header_validation.core.config_loader import (
     ConfigLoader,
 )
+from markdown_inspector.features.header_validation.core.matcher import HeadingMatcher
 
-__all__ = ["HeaderValidator", "ConfigLoader"]
+__all__ = ["HeaderValidator", "ConfigLoader", "HeadingMatcher"]
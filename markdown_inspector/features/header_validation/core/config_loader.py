@@ -38,10 +38,17 @@ class ConfigLoader:
         """
         Validate that the configuration has the required structure.
 
+        A configuration needs a list of flat "headings" requirements, a list of
+        nested "sections" requirements, or both.
+
         Args:
             config: The configuration dictionary to validate
 
         Returns:
             True if the configuration is valid, False otherwise
         """
-        return "headings" in config and isinstance(config["headings"], list)
+        if "headings" in config and not isinstance(config["headings"], list):
+            return False
+        if "sections" in config and not isinstance(config["sections"], list):
+            return False
+        return "headings" in config or "sections" in config
@@ -0,0 +1,172 @@
+"""
+Heading matcher module for Markdown Inspector.
+Compiles the heading requirements of a configuration into a single matcher.
+"""
+
+import re
+import fnmatch
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Inline flags such as "(?i)", which are only allowed at the start of a regex
+GLOBAL_FLAGS_PATTERN = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# Numbered backreferences and conditionals, which refer to groups by position
+GROUP_REFERENCE_PATTERN = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+
+def scope_flags(regex: str) -> str:
+    """
+    Rewrite the leading inline flags of a regex as a scoped group.
+
+    Args:
+        regex: A regular expression, such as "(?i)release notes"
+
+    Returns:
+        The same expression with its flags limited to itself, such as
+        "(?i:release notes)", so that it can be part of a larger regex
+    """
+    flags = ""
+    position = 0
+    match = GLOBAL_FLAGS_PATTERN.match(regex)
+    while match:
+        flags += match.group(1)
+        position = match.end()
+        match = GLOBAL_FLAGS_PATTERN.match(regex, position)
+    if not flags:
+        return regex
+    # A verbose comment on the last line would otherwise swallow the ")"
+    end = "\n)" if "x" in flags else ")"
+    return f"(?{flags}:{regex[position:]}{end}"
+
+
+class HeadingMatcher:
+    """Classifies header titles against the heading requirements of a config."""
+
+    def __init__(self, headings: List[Dict[str, Any]]):
+        """
+        Compile the heading requirements.
+
+        A requirement matches on an exact "title", any of several exact
+        "titles", a shell-style "glob" or a regular expression "pattern".
+        Exact titles are kept in a dictionary; globs and patterns are combined
+        into one alternation so a title is classified in a single regex pass.
+        Leading inline flags are scoped to their own pattern. A pattern that
+        refers to its groups by number, or cannot be combined with the
+        patterns before it, gets a regex of its own, tried in configuration
+        order.
+
+        Args:
+            headings: List of heading requirements from the configuration
+
+        Raises:
+            ValueError: If a requirement has no title, titles, glob or pattern,
+                or if a pattern is not a valid regular expression
+        """
+        self.headings = headings
+        self.exact: Dict[str, int] = {}
+        # Regexes in configuration order, with the requirement index of a
+        # single pattern or None for an alternation of named groups
+        self.regexes: List[Tuple[Pattern, Optional[int]]] = []
+        alternatives: List[str] = []
+
+        for index, heading in enumerate(headings):
+            titles = list(heading.get("titles", []))
+            if "title" in heading:
+                titles.insert(0, heading["title"])
+            for title in titles:
+                self.exact.setdefault(title, index)
+
+            regex = heading.get("pattern")
+            if regex is None and "glob" in heading:
+                regex = fnmatch.translate(heading["glob"])
+            if regex is None:
+                if not titles:
+                    raise ValueError(
+                        f"Heading requirement {index} needs a title, titles, "
+                        "glob or pattern"
+                    )
+                continue
+
+            try:
+                compiled = re.compile(regex)
+            except re.error as e:
+                raise ValueError(f"Invalid heading pattern '{regex}': {e}")
+
+            if GROUP_REFERENCE_PATTERN.search(regex):
+                # Group numbers would shift inside an alternation
+                self._add_alternation(alternatives)
+                alternatives = []
+                self.regexes.append((compiled, index))
+                continue
+
+            alternative = f"(?P<h{index}>{scope_flags(regex)})"
+            try:
+                re.compile("|".join(alternatives + [alternative]))
+            except re.error:
+                # Such as a group name used by an earlier pattern
+                self._add_alternation(alternatives)
+                alternatives = []
+                try:
+                    re.compile(alternative)
+                except re.error:
+                    self.regexes.append((compiled, index))
+                    continue
+            alternatives.append(alternative)
+
+        self._add_alternation(alternatives)
+
+    def _add_alternation(self, alternatives: List[str]) -> None:
+        """
+        Compile pending pattern alternatives into one regex.
+
+        Args:
+            alternatives: Named groups "h<index>" wrapping the patterns
+        """
+        if alternatives:
+            self.regexes.append((re.compile("|".join(alternatives)), None))
+
+    def match(self, title: str) -> Optional[int]:
+        """
+        Find the requirement a header title satisfies.
+
+        Args:
+            title: The header title
+
+        Returns:
+            Index of the matching requirement, or None if there is none. Exact
+            titles take precedence over globs and patterns, which are tried in
+            configuration order
+        """
+        index = self.exact.get(title)
+        if index is not None:
+            return index
+
+        for regex, index in self.regexes:
+            match = regex.fullmatch(title)
+            if match is None:
+                continue
+            if index is not None:
+                return index
+            # The named group of a requirement closes last, so it is the
+            # lastgroup
+            return int(match.lastgroup[1:])
+        return None
+
+    def label(self, index: int) -> str:
+        """
+        Describe a requirement in validation messages.
+
+        Args:
+            index: Index of the requirement
+
+        Returns:
+            Its "name" if given, otherwise its title, alternatives, glob or pattern
+        """
+        heading = self.headings[index]
+        if "name" in heading:
+            return heading["name"]
+        if "title" in heading:
+            return heading["title"]
+        if heading.get("titles"):
+            return " | ".join(heading["titles"])
+        return heading.get("glob", heading.get("pattern"))
@@ -0,0 +1,48 @@
+"""
+Header validation rule plugin for Markdown Inspector.
+Runs the header validator on the headings emitted by the rule engine.
+"""
+
+from typing import Any, Dict, List
+from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+from markdown_inspector.features.rule_engine.core.plugin import (
+    ERROR,
+    INFO,
+    FileContext,
+    RulePlugin,
+    make_finding,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import HEADING
+
+
+class HeaderValidationRule(RulePlugin):
+    """Validates the document headings against the configuration requirements."""
+
+    name = "header_validation"
+    events = frozenset([HEADING])
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the rule and compile the heading requirements.
+
+        Args:
+            config: The configuration dictionary
+        """
+        super().__init__(config)
+        self.validator = HeaderValidator(config)
+
+    def start(self, context: FileContext) -> None:
+        """Start collecting headers; other plugins may read them from the context."""
+        context.data["headers"] = []
+
+    def handle(self, event: Dict[str, Any], context: FileContext) -> None:
+        """Collect a heading."""
+        context.data["headers"].append(
+            {"title": event["title"], "level": event["level"], "line": event["line"]}
+        )
+
+    def finish(self, context: FileContext) -> List[Dict[str, Any]]:
+        """Validate the collected headers."""
+        success, messages = self.validator.validate_headers(context.data["headers"])
+        severity = INFO if success else ERROR
+        return [make_finding(self.name, message, severity) for message in messages]
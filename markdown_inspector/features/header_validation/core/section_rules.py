@@ -0,0 +1,166 @@
+"""
+Section rules module for Markdown Inspector.
+Validates hierarchical section requirements against the tree of headers.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from markdown_inspector.features.header_validation.core.matcher import HeadingMatcher
+
+
+class _SectionRule:
+    """A compiled section requirement and the matchers for its children."""
+
+    def __init__(self, config: Dict[str, Any], label: str):
+        self.label = label
+        self.level = config.get("level")
+        self.min_count = config.get("min_count", 1)
+        self.max_count = config.get("max_count")
+        self.allow_extra = config.get("allow_extra", True)
+
+        self.children: List["_SectionRule"] = []
+        titled_configs = []
+        titled_children = []
+        self.level_children: List["_SectionRule"] = []
+        for child_config in config.get("children", []):
+            if any(
+                key in child_config for key in ("title", "titles", "glob", "pattern")
+            ):
+                titled_configs.append(child_config)
+                child = _SectionRule(child_config, "")
+                titled_children.append(child)
+            else:
+                if "level" not in child_config:
+                    raise ValueError(
+                        "Section requirement needs a title, titles, glob, "
+                        "pattern or level"
+                    )
+                name = child_config.get(
+                    "name", f"level {child_config['level']} heading"
+                )
+                child = _SectionRule(child_config, name)
+                self.level_children.append(child)
+            self.children.append(child)
+
+        # Titled children are classified through one compiled matcher
+        self.child_matcher = HeadingMatcher(titled_configs)
+        for index, child in enumerate(titled_children):
+            child.label = self.child_matcher.label(index)
+        self.titled_children = titled_children
+
+    def classify(self, header: Dict[str, Any]) -> List["_SectionRule"]:
+        """Find the child requirements a header satisfies."""
+        matched = []
+        index = self.child_matcher.match(header["title"])
+        if index is not None:
+            matched.append(self.titled_children[index])
+        for child in self.level_children:
+            if child.level == header["level"]:
+                matched.append(child)
+        return matched
+
+
+class _Section:
+    """An open section while the header list is scanned."""
+
+    def __init__(self, level: int, title: Optional[str], rules: List[_SectionRule]):
+        self.level = level
+        self.title = title
+        self.rules = rules
+        self.counts: Dict[_SectionRule, int] = {}
+
+
+class SectionTreeValidator:
+    """Validates nested section requirements in a single pass over the headers."""
+
+    def __init__(self, sections: List[Dict[str, Any]], allow_extra: bool = True):
+        """
+        Compile the section requirements.
+
+        Each requirement matches a heading like a heading requirement does, or
+        any heading of its "level" if it has no title, titles, glob or pattern.
+        It may set "min_count" (default 1), "max_count", "allow_extra" (default
+        true) for headings directly below it that match none of its
+        requirements, and nested "children" requirements.
+
+        Args:
+            sections: Requirements for the top-level sections of the document
+            allow_extra: Whether unmatched top-level sections are allowed
+
+        Raises:
+            ValueError: If a requirement cannot be compiled
+        """
+        self.root = _SectionRule(
+            {"children": sections, "allow_extra": allow_extra}, "document"
+        )
+
+    def validate(self, actual_headers: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+        """
+        Validate the section tree formed by the headers.
+
+        The tree is built while scanning: a stack holds the open sections, and
+        a section's child counts are checked as soon as the section closes.
+
+        Args:
+            actual_headers: List of dictionaries with header info
+
+        Returns:
+            Tuple of (success_flag, list_of_validation_messages)
+        """
+        messages: List[str] = []
+        stack = [_Section(0, None, [self.root])]
+
+        for header in actual_headers:
+            while stack[-1].level >= header["level"]:
+                self._close(stack.pop(), messages)
+            parent = stack[-1]
+
+            matched = []
+            for rule in parent.rules:
+                matched.extend(rule.classify(header))
+            for child in matched:
+                parent.counts[child] = parent.counts.get(child, 0) + 1
+                if child.level is not None and child.level != header["level"]:
+                    messages.append(
+                        f"Header level mismatch for '{header['title']}': "
+                        f"expected level {child.level}, got level {header['level']}"
+                    )
+
+            if not matched and not all(rule.allow_extra for rule in parent.rules):
+                messages.append(
+                    f"Unexpected section '{header['title']}' "
+                    f"{self._location(parent)}"
+                )
+
+            stack.append(_Section(header["level"], header["title"], matched))
+
+        while stack:
+            self._close(stack.pop(), messages)
+
+        return not messages, messages
+
+    @staticmethod
+    def _location(section: _Section) -> str:
+        """Describe where a section sits in messages."""
+        if section.title is None:
+            return "in the document"
+        return f"under '{section.title}'"
+
+    def _close(self, section: _Section, messages: List[str]) -> None:
+        """Check the child counts of a section that has no more children."""
+        for rule in section.rules:
+            for child in rule.children:
+                count = section.counts.get(child, 0)
+                if count == 0 and child.min_count > 0:
+                    messages.append(
+                        f"Missing section '{child.label}' {self._location(section)}"
+                    )
+                elif count < child.min_count:
+                    messages.append(
+                        f"Expected at least {child.min_count} '{child.label}' "
+                        f"sections {self._location(section)}, found {count}"
+                    )
+                elif child.max_count is not None and count > child.max_count:
+                    messages.append(
+                        f"Expected at most {child.max_count} '{child.label}' "
+                        f"sections {self._location(section)}, found {count}"
+                    )
@@ -0,0 +1,180 @@
+"""
+Suggestions module for Markdown Inspector.
+Finds the document heading closest to a missing required header.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+# Anything that is neither a word character nor whitespace counts as punctuation
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_title(title: str, unicode_normalize: bool = False) -> str:
+    """
+    Normalize a header title for comparison.
+
+    Case, punctuation and runs of whitespace are folded so that titles that
+    only differ in these compare equal.
+
+    Args:
+        title: The header title
+        unicode_normalize: Whether to apply Unicode NFKC normalization first
+
+    Returns:
+        The normalized title
+    """
+    if unicode_normalize:
+        title = unicodedata.normalize("NFKC", title)
+    return " ".join(_PUNCTUATION.sub(" ", title.casefold()).split())
+
+
+def edit_distance(first: str, second: str) -> int:
+    """
+    Compute the Levenshtein distance between two strings.
+
+    Args:
+        first: The first string
+        second: The second string
+
+    Returns:
+        Minimum number of insertions, deletions and substitutions
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (first_char != second_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree for edit-distance searches over strings."""
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the tree.
+
+        Args:
+            word: The word to add
+        """
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Find the words within an edit distance of a word.
+
+        Only subtrees whose edge distance lies within max_distance of the
+        distance to their parent can hold matches, so the others are skipped.
+
+        Args:
+            word: The word to search for
+            max_distance: Largest edit distance to report
+
+        Returns:
+            List of (distance, word) tuples sorted by distance
+        """
+        matches = []
+        nodes = [self.root] if self.root is not None else []
+        while nodes:
+            node_word, children = nodes.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                matches.append((distance, node_word))
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    nodes.append(child)
+        return sorted(matches)
+
+
+class TitleSuggester:
+    """Suggests document headings for missing required headers."""
+
+    def __init__(
+        self,
+        required_titles: List[str],
+        max_distance: int = 2,
+        unicode_normalize: bool = False,
+    ):
+        """
+        Precompute the normalized required titles.
+
+        Args:
+            required_titles: Titles of the required headers
+            max_distance: Largest edit distance between normalized titles
+            unicode_normalize: Whether to apply Unicode NFKC normalization
+        """
+        self.max_distance = max_distance
+        self.unicode_normalize = unicode_normalize
+        self.normalized_required = {
+            title: normalize_title(title, unicode_normalize)
+            for title in required_titles
+        }
+
+    def suggest(self, missing_titles: List[str], headings: List[str]) -> Dict[str, str]:
+        """
+        Find the closest heading for each missing title.
+
+        The headings are indexed once by their normalized form. A missing title
+        whose normalized form is indexed gets that heading; otherwise the index
+        is searched through a BK-tree within the distance bound, which is
+        tightened for short titles.
+
+        Args:
+            missing_titles: Required titles missing from the document
+            headings: Titles of the document headings that matched no requirement
+
+        Returns:
+            Dictionary mapping missing titles to the suggested heading
+        """
+        index: Dict[str, str] = {}
+        for heading in headings:
+            index.setdefault(normalize_title(heading, self.unicode_normalize), heading)
+
+        tree = None
+        suggestions = {}
+        for title in missing_titles:
+            key = self.normalized_required.get(title)
+            if key is None:
+                key = normalize_title(title, self.unicode_normalize)
+            if key in index:
+                suggestions[title] = index[key]
+                continue
+
+            limit = min(self.max_distance, len(key) // 4)
+            if limit < 1:
+                continue
+            if tree is None:
+                tree = BKTree()
+                for normalized in index:
+                    tree.add(normalized)
+            matches = tree.search(key, limit)
+            if matches:
+                suggestions[title] = index[matches[0][1]]
+        return suggestions
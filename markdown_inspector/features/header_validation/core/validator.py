@@ -5,6 +5,18 @@ Handles parsing markdown headers and validating against configuration requiremen
 
 import re
 from typing import Dict, List, Tuple, Any
+from markdown_inspector.features.header_validation.core.matcher import HeadingMatcher
+from markdown_inspector.features.header_validation.core.section_rules import (
+    SectionTreeValidator,
+)
+from markdown_inspector.features.header_validation.core.suggestions import (
+    TitleSuggester,
+)
+
+# Regular expression to match markdown headers (# Header, ## Header, etc.).
+# Only spaces and tabs separate the parts, so a match never spans lines, and
+# the carriage return of a CRLF line ending is not part of the title.
+HEADER_PATTERN = re.compile(r"^(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?\r?$", re.MULTILINE)
 
 
 class HeaderValidator:
@@ -16,8 +28,35 @@ class HeaderValidator:
 
         Args:
             config: Dictionary containing the validation configuration
+
+        Raises:
+            ValueError: If a heading or section requirement cannot be compiled
         """
         self.config = config
+        self.matcher = HeadingMatcher(config.get("headings", []))
+        self.section_validator = None
+        if "sections" in config:
+            self.section_validator = SectionTreeValidator(
+                config["sections"], config.get("allow_extra_sections", True)
+            )
+
+        # Suggestions for missing headers are on unless disabled with false
+        self.suggester = None
+        suggestion_options = config.get("suggestions", {})
+        if suggestion_options is not False:
+            if suggestion_options is True:
+                suggestion_options = {}
+            required_titles = [
+                title
+                for heading in config.get("headings", [])
+                for title in [heading.get("title")] + list(heading.get("titles", []))
+                if title is not None
+            ]
+            self.suggester = TitleSuggester(
+                required_titles,
+                max_distance=suggestion_options.get("max_distance", 2),
+                unicode_normalize=suggestion_options.get("unicode_normalize", False),
+            )
 
     def parse_markdown_headers(self, markdown_content: str) -> List[Dict[str, Any]]:
         """
@@ -29,11 +68,8 @@ class HeaderValidator:
         Returns:
             List of dictionaries with header info (title, level)
         """
-        # Regular expression to match markdown headers (# Header, ## Header, etc.)
-        header_pattern = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#+)?$", re.MULTILINE)
-
         headers = []
-        for match in header_pattern.finditer(markdown_content):
+        for match in HEADER_PATTERN.finditer(markdown_content):
             level = len(match.group(1))
             title = match.group(2).strip()
             headers.append({"title": title, "level": level})
@@ -48,7 +84,10 @@ class HeaderValidator:
         
         This validation supports documents that have additional headers between the
         required headers - only the headers specified in the configuration are checked
-        for existence, correct order, and proper level.
+        for existence, correct order, and proper level. A required header is matched
+        by its exact title, one of its alternative titles, a glob or a regex pattern.
+        Nested "sections" requirements, if configured, are checked against the tree
+        formed by the headers.
 
         Args:
             actual_headers: List of dictionaries with header info
@@ -56,52 +95,95 @@ class HeaderValidator:
         Returns:
             Tuple of (success_flag, list_of_validation_messages)
         """
-        if "headings" not in self.config:
+        if "headings" not in self.config and self.section_validator is None:
             return False, ["Configuration file does not contain 'headings' key"]
 
-        expected_headers = self.config["headings"]
+        expected_headers = self.config.get("headings", [])
         messages = []
         success = True
 
-        # Check if all required headers exist
-        actual_titles = [h["title"] for h in actual_headers]
-        for expected in expected_headers:
-            if expected["title"] not in actual_titles:
-                messages.append(f"Missing header: '{expected['title']}'")
-                success = False
+        # Classify each header once; unmatched headers are additional headers
+        # and may appear anywhere between the required ones
+        matched_headers = []
+        unmatched_titles = []
+        for header in actual_headers:
+            index = self.matcher.match(header["title"])
+            if index is not None:
+                matched_headers.append((header, index))
+            else:
+                unmatched_titles.append(header["title"])
 
-        # Extract only the required headers from the document, preserving their order
-        # This allows for additional headers to exist between required headers
-        filtered_actual_headers = [h for h in actual_headers if h["title"] in [eh["title"] for eh in expected_headers]]
-        actual_titles_ordered = [h["title"] for h in filtered_actual_headers]
-
-        # Create a map of titles that appear in both lists
-        title_positions_expected = {title["title"]: i for i, title in enumerate(expected_headers)}
+        # Check if all required headers exist
+        found = {index for _, index in matched_headers}
+        missing = [i for i in range(len(expected_headers)) if i not in found]
+        suggestions = self._suggest(missing, unmatched_titles)
+        for index in missing:
+            message = f"Missing header: '{self.matcher.label(index)}'"
+            if index in suggestions:
+                message += f" (did you mean '{suggestions[index]}'?)"
+            messages.append(message)
+            success = False
 
         # Check if the relative order of required headers matches the expected order
         previous_position = -1
-        for title in actual_titles_ordered:
-            if title in title_positions_expected:
-                current_position = title_positions_expected[title]
-                if current_position < previous_position:
-                    messages.append(f"Header '{title}' is out of order")
-                    success = False
-                previous_position = current_position
+        for header, current_position in matched_headers:
+            if current_position < previous_position:
+                messages.append(f"Header '{header['title']}' is out of order")
+                success = False
+            previous_position = current_position
 
         # Check header levels
-        for actual in actual_headers:
-            for expected in expected_headers:
-                if (
-                    actual["title"] == expected["title"]
-                    and actual["level"] != expected["level"]
-                ):
-                    messages.append(
-                        f"Header level mismatch for '{actual['title']}': "
-                        f"expected level {expected['level']}, got level {actual['level']}"
-                    )
-                    success = False
+        for header, index in matched_headers:
+            expected_level = expected_headers[index].get("level")
+            if expected_level is not None and header["level"] != expected_level:
+                messages.append(
+                    f"Header level mismatch for '{header['title']}': "
+                    f"expected level {expected_level}, got level {header['level']}"
+                )
+                success = False
+
+        # Check the nested section requirements
+        if self.section_validator is not None:
+            sections_valid, section_messages = self.section_validator.validate(
+                actual_headers
+            )
+            messages.extend(section_messages)
+            success = success and sections_valid
 
         if success:
             messages.append("All headers validated successfully")
 
         return success, messages
+
+    def _suggest(
+        self, missing: List[int], unmatched_titles: List[str]
+    ) -> Dict[int, str]:
+        """
+        Suggest document headings for missing required headers.
+
+        Only exact-title requirements get suggestions, taken from the headings
+        that matched no requirement.
+
+        Args:
+            missing: Indexes of the missing heading requirements
+            unmatched_titles: Titles of the headers that matched no requirement
+
+        Returns:
+            Dictionary mapping requirement indexes to a suggested heading title
+        """
+        if self.suggester is None or not missing or not unmatched_titles:
+            return {}
+
+        expected_headers = self.config["headings"]
+        candidates = {}
+        for index in missing:
+            heading = expected_headers[index]
+            titles = [heading["title"]] if "title" in heading else []
+            for title in titles + list(heading.get("titles", [])):
+                candidates.setdefault(title, index)
+
+        suggestions: Dict[int, str] = {}
+        found = self.suggester.suggest(list(candidates), unmatched_titles)
+        for title, heading_title in found.items():
+            suggestions.setdefault(candidates[title], heading_title)
+        return suggestions
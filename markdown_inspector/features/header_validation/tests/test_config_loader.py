@@ -67,11 +67,13 @@ class TestConfigLoader(unittest.TestCase):
         # Valid config
         valid_config = {"headings": [{"title": "Test", "level": 1}]}
         self.assertTrue(ConfigLoader.validate_config(valid_config))
+        self.assertTrue(ConfigLoader.validate_config({"sections": [{"level": 1}]}))
 
         # Invalid configs
         self.assertFalse(ConfigLoader.validate_config({}))
         self.assertFalse(ConfigLoader.validate_config({"headings": "not a list"}))
         self.assertFalse(ConfigLoader.validate_config({"wrong_key": []}))
+        self.assertFalse(ConfigLoader.validate_config({"sections": "not a list"}))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Tests for the heading matcher module.
+"""
+
+import unittest
+
+from markdown_inspector.features.header_validation.core.matcher import HeadingMatcher
+
+
+class TestHeadingMatcher(unittest.TestCase):
+    """Test cases for the HeadingMatcher."""
+
+    def setUp(self):
+        """Set up a matcher with every kind of requirement."""
+        self.matcher = HeadingMatcher(
+            [
+                {"title": "Introduction", "level": 2},
+                {"titles": ["Rollback", "Rollback Plan"], "level": 2},
+                {"glob": "Release *.* Notes", "level": 2},
+                {"pattern": r"Appendix [A-Z](: .+)?", "name": "Appendix"},
+            ]
+        )
+
+    def test_exact_titles(self):
+        """Test matching exact and alternative titles."""
+        self.assertEqual(self.matcher.match("Introduction"), 0)
+        self.assertEqual(self.matcher.match("Rollback"), 1)
+        self.assertEqual(self.matcher.match("Rollback Plan"), 1)
+
+    def test_glob_and_pattern(self):
+        """Test matching globs and regex patterns through the combined regex."""
+        self.assertEqual(self.matcher.match("Release 1.2 Notes"), 2)
+        self.assertEqual(self.matcher.match("Appendix B"), 3)
+        self.assertEqual(self.matcher.match("Appendix C: Glossary"), 3)
+
+    def test_no_match(self):
+        """Test that titles must match completely."""
+        self.assertIsNone(self.matcher.match("Introduction to it"))
+        self.assertIsNone(self.matcher.match("Release Notes"))
+        self.assertIsNone(self.matcher.match("Appendix BB"))
+
+    def test_labels(self):
+        """Test the labels used in validation messages."""
+        self.assertEqual(self.matcher.label(0), "Introduction")
+        self.assertEqual(self.matcher.label(1), "Rollback | Rollback Plan")
+        self.assertEqual(self.matcher.label(2), "Release *.* Notes")
+        self.assertEqual(self.matcher.label(3), "Appendix")
+
+    def test_inline_flags(self):
+        """Test that leading inline flags only apply to their own pattern."""
+        matcher = HeadingMatcher(
+            [
+                {"pattern": "Summary"},
+                {"pattern": "(?i)release notes"},
+                {"pattern": "(?x) Change \\ Log  # verbose comment"},
+            ]
+        )
+
+        self.assertEqual(matcher.match("Release NOTES"), 1)
+        self.assertEqual(matcher.match("Change Log"), 2)
+        self.assertIsNone(matcher.match("summary"))
+        self.assertEqual(len(matcher.regexes), 1)
+
+    def test_group_references(self):
+        """Test patterns that refer to their own groups by number or name."""
+        matcher = HeadingMatcher(
+            [
+                {"pattern": r"(\w+) and \1"},
+                {"pattern": r"(\d+)-\1"},
+                {"pattern": r"(?P<h0>Step) (?P<n>\d+)"},
+                {"pattern": r"(?P<n>\w+) again"},
+                {"pattern": r"Literal \\1"},
+            ]
+        )
+
+        self.assertEqual(matcher.match("Install and Install"), 0)
+        self.assertIsNone(matcher.match("Install and Usage"))
+        self.assertEqual(matcher.match("12-12"), 1)
+        self.assertEqual(matcher.match("Step 3"), 2)
+        self.assertEqual(matcher.match("Setup again"), 3)
+        self.assertEqual(matcher.match("Literal \\1"), 4)
+
+    def test_invalid_requirements(self):
+        """Test that invalid requirements are rejected when compiling."""
+        with self.assertRaises(ValueError):
+            HeadingMatcher([{"pattern": "Release ("}])
+        with self.assertRaises(ValueError):
+            HeadingMatcher([{"level": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the section rules module.
+"""
+
+import unittest
+
+from markdown_inspector.features.header_validation.core.section_rules import (
+    SectionTreeValidator,
+)
+from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+
+
+class TestSectionTreeValidator(unittest.TestCase):
+    """Test cases for the SectionTreeValidator."""
+
+    def setUp(self):
+        """Set up nested section requirements."""
+        self.sections = [
+            {
+                "level": 1,
+                "name": "H1",
+                "max_count": 1,
+                "children": [
+                    {
+                        "title": "Deployment",
+                        "level": 2,
+                        "allow_extra": False,
+                        "children": [
+                            {"title": "Prerequisites", "level": 3},
+                            {"titles": ["Rollback", "Rollback Plan"], "level": 3},
+                        ],
+                    }
+                ],
+            }
+        ]
+        self.validator = SectionTreeValidator(self.sections)
+        self.parser = HeaderValidator({"headings": []})
+
+    def _validate(self, content):
+        """Helper to validate the section tree of markdown content."""
+        headers = self.parser.parse_markdown_headers(content)
+        return self.validator.validate(headers)
+
+    def test_valid_tree(self):
+        """Test a document satisfying every section requirement."""
+        success, messages = self._validate(
+            "# Guide\n## Intro\n## Deployment\n### Prerequisites\n"
+            "#### Details\n### Rollback Plan\n## Appendix\n"
+        )
+
+        self.assertTrue(success, messages)
+        self.assertEqual(messages, [])
+
+    def test_missing_child(self):
+        """Test that a missing required child is reported under its parent."""
+        success, messages = self._validate(
+            "# Guide\n## Deployment\n### Prerequisites\n## Rollback\n"
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(
+            messages, ["Missing section 'Rollback | Rollback Plan' under 'Deployment'"]
+        )
+
+    def test_counts_and_extra_sections(self):
+        """Test max counts and headings not allowed below a section."""
+        success, messages = self._validate(
+            "# Guide\n## Deployment\n### Prerequisites\n### Notes\n"
+            "### Rollback\n# Second\n"
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(
+            messages,
+            [
+                "Unexpected section 'Notes' under 'Deployment'",
+                "Missing section 'Deployment' under 'Second'",
+                "Expected at most 1 'H1' sections in the document, found 2",
+            ],
+        )
+
+    def test_level_mismatch(self):
+        """Test that a matched section at the wrong level is reported."""
+        success, messages = self._validate(
+            "# Guide\n## Deployment\n#### Prerequisites\n### Rollback\n"
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(
+            messages,
+            [
+                "Header level mismatch for 'Prerequisites': expected level 3, got level 4"
+            ],
+        )
+
+    def test_header_validator_with_sections(self):
+        """Test that the header validator checks sections without headings."""
+        validator = HeaderValidator({"sections": self.sections})
+        headers = validator.parse_markdown_headers("# Guide\n## Deployment\n")
+        success, messages = validator.validate_headers(headers)
+
+        self.assertFalse(success)
+        self.assertIn("Missing section 'Prerequisites' under 'Deployment'", messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the suggestions module.
+"""
+
+import unittest
+
+from markdown_inspector.features.header_validation.core.suggestions import (
+    BKTree,
+    TitleSuggester,
+    edit_distance,
+    normalize_title,
+)
+from markdown_inspector.features.header_validation.core.validator import HeaderValidator
+
+
+class TestSuggestions(unittest.TestCase):
+    """Test cases for the title suggestions."""
+
+    def test_normalize_title(self):
+        """Test folding case, punctuation and whitespace."""
+        self.assertEqual(normalize_title("  User   Overview: "), "user overview")
+        self.assertEqual(normalize_title("Set-up & Install"), "set up install")
+        self.assertEqual(
+            normalize_title("ＡＰＩ Guide", unicode_normalize=True), "api guide"
+        )
+
+    def test_edit_distance(self):
+        """Test the Levenshtein distance."""
+        self.assertEqual(edit_distance("overview", "overveiw"), 2)
+        self.assertEqual(edit_distance("", "abc"), 3)
+        self.assertEqual(edit_distance("same", "same"), 0)
+
+    def test_bk_tree_search(self):
+        """Test that the BK-tree finds exactly the words within the bound."""
+        words = ["introduction", "user overview", "user interface", "security"]
+        tree = BKTree()
+        for word in words:
+            tree.add(word)
+
+        for query in ["user overveiw", "securty", "nothing like it"]:
+            expected = sorted(
+                (edit_distance(query, word), word)
+                for word in words
+                if edit_distance(query, word) <= 2
+            )
+            self.assertEqual(tree.search(query, 2), expected)
+
+    def test_suggest(self):
+        """Test suggestions from the normalized index and the fuzzy search."""
+        suggester = TitleSuggester(["User Overview", "Security", "FAQ"])
+        suggestions = suggester.suggest(
+            ["User Overview", "Security", "FAQ"],
+            ["user overview", "Securty", "FAX"],
+        )
+
+        self.assertEqual(
+            suggestions, {"User Overview": "user overview", "Security": "Securty"}
+        )
+
+    def test_missing_header_message(self):
+        """Test that missing header messages carry the suggestion."""
+        validator = HeaderValidator(
+            {
+                "headings": [
+                    {"title": "User Document", "level": 1},
+                    {"title": "User Overview", "level": 2},
+                ]
+            }
+        )
+        headers = validator.parse_markdown_headers(
+            "# User Document\n## User overveiw\n"
+        )
+        success, messages = validator.validate_headers(headers)
+
+        self.assertFalse(success)
+        self.assertEqual(
+            messages,
+            ["Missing header: 'User Overview' (did you mean 'User overveiw'?)"],
+        )
+
+        validator.config["suggestions"] = False
+        validator = HeaderValidator(validator.config)
+        success, messages = validator.validate_headers(headers)
+        self.assertEqual(messages, ["Missing header: 'User Overview'"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -108,6 +108,33 @@ class TestHeaderValidator(unittest.TestCase):
         self.assertTrue(success, "Should pass with additional headers between required headers")
         self.assertIn("All headers validated successfully", messages)
 
+    def test_pattern_headers(self):
+        """Test validating headers against glob, regex and alternative titles."""
+        validator = HeaderValidator(
+            {
+                "headings": [
+                    {"glob": "Release *.* Notes", "level": 1},
+                    {"titles": ["Rollback", "Rollback Plan"], "level": 2},
+                    {"pattern": "Known (Issues|Bugs)", "level": 2},
+                ]
+            }
+        )
+
+        content = "# Release 2.4 Notes\n\n## Rollback Plan\n\n## Known Bugs\n"
+        headers = validator.parse_markdown_headers(content)
+        success, messages = validator.validate_headers(headers)
+        self.assertTrue(success)
+
+        content = "# Release 2.4 Notes\n\n### Known Issues\n"
+        headers = validator.parse_markdown_headers(content)
+        success, messages = validator.validate_headers(headers)
+        self.assertFalse(success)
+        self.assertIn("Missing header: 'Rollback | Rollback Plan'", messages)
+        self.assertIn(
+            "Header level mismatch for 'Known Issues': expected level 2, got level 3",
+            messages,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
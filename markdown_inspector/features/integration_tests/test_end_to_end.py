@@ -135,6 +135,96 @@ class TestEndToEnd(unittest.TestCase):
         # Verify failure - actual implementation returns exit code 1 for non-existent files
         self.assertEqual(exit_code, 1)
 
+    @patch("sys.argv")
+    def test_batch_documents(self, mock_argv):
+        """Test CLI with several target documents in batch mode."""
+        # Set up CLI arguments
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "markdowninspector",
+            "--config",
+            self.config_file.name,
+            "--target",
+            self.valid_md.name,
+            self.invalid_md.name,
+            "--output-format",
+            "json",
+        ][i]
+
+        # Run CLI and capture output
+        with patch("sys.stdout") as mock_stdout:
+            exit_code = main()
+
+        # Verify the batch failed because of the invalid document
+        self.assertEqual(exit_code, 1)
+        output = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
+        report = json.loads(output)
+        self.assertTrue(report["results"][self.valid_md.name]["success"])
+        self.assertFalse(report["results"][self.invalid_md.name]["success"])
+        self.assertNotIn("timings", report)
+
+    def test_batch_timings(self):
+        """Test that --timings reports the rule timings of a batch."""
+        arguments = [
+            "--config",
+            self.config_file.name,
+            "--target",
+            self.valid_md.name,
+            self.invalid_md.name,
+            "--timings",
+        ]
+
+        with patch("sys.stdout") as mock_stdout:
+            main(arguments)
+        output = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
+        self.assertIn("Rule timings:\n- header_validation: ", output)
+
+        with patch("sys.stdout") as mock_stdout:
+            main(arguments + ["--output-format", "json"])
+        output = "".join(call.args[0] for call in mock_stdout.write.call_args_list)
+        self.assertIn("header_validation", json.loads(output)["timings"])
+
+    def test_encoded_document(self):
+        """Test CLI with a BOM, CRLF line endings and a stray Latin-1 byte."""
+        with open(self.valid_md.name, "wb") as md_file:
+            md_file.write(
+                b"\xef\xbb\xbf# Test Document\r\n\r\nCaf\xe9 menu\r\n"
+                b"## Section One ##\r\n## Section Two\r\n## Conclusion\r\n"
+            )
+        arguments = ["--config", self.config_file.name, "--target"]
+
+        with patch("sys.stdout"):
+            exit_code = main(arguments + [self.valid_md.name])
+            strict_exit_code = main(
+                arguments + [self.valid_md.name, "--encoding-errors", "strict"]
+            )
+
+        # Only heading text is decoded, so the body byte never fails
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(strict_exit_code, 0)
+
+    def test_fix_document(self):
+        """Test that --fix makes a document with a wrong level pass."""
+        with open(self.invalid_md.name, "w") as md_file:
+            md_file.write(
+                "# test document\n\n## Section One\n\n## Section Two\n\n# Conclusion\n"
+            )
+        arguments = [
+            "--config",
+            self.config_file.name,
+            "--target",
+            self.invalid_md.name,
+        ]
+
+        with patch("sys.stdout"):
+            dry_run_exit_code = main(arguments + ["--fix-dry-run"])
+            fix_exit_code = main(arguments + ["--fix"])
+            exit_code = main(arguments)
+
+        # The dry run reports pending fixes, after which the document passes
+        self.assertEqual(dry_run_exit_code, 1)
+        self.assertEqual(fix_exit_code, 0)
+        self.assertEqual(exit_code, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,19 @@
+"""
+Rule engine feature for markdown files.
+"""
+
+from markdown_inspector.features.rule_engine.core.engine import RuleEngine
+from markdown_inspector.features.rule_engine.core.plugin import (
+    FileContext,
+    RulePlugin,
+    make_finding,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import MarkdownTokenizer
+
+__all__ = [
+    "RuleEngine",
+    "FileContext",
+    "RulePlugin",
+    "make_finding",
+    "MarkdownTokenizer",
+]
@@ -0,0 +1,3 @@
+"""
+Core functionality for rule engine feature.
+"""
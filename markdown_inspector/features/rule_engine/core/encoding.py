@@ -0,0 +1,97 @@
+"""
+Encoding module for Markdown Inspector.
+Chooses how the raw bytes of a markdown file are tokenized.
+"""
+
+import codecs
+from typing import Tuple, Union
+
+DEFAULT_ENCODING = "utf-8"
+DEFAULT_ERRORS = "replace"
+
+# Checked in this order, since the UTF-32 LE mark starts with the UTF-16 LE one
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_ASCII = bytes(range(128))
+
+
+def detect_encoding(data: bytes, encoding: str = DEFAULT_ENCODING) -> str:
+    """
+    Determine the encoding of a markdown file.
+
+    A byte order mark takes precedence over the given encoding. UTF-8 with a
+    signature is reported as plain UTF-8, since the tokenizer skips the mark.
+
+    Args:
+        data: The raw content of the markdown file
+        encoding: Encoding to assume when the file has no byte order mark
+
+    Returns:
+        The normalized codec name
+
+    Raises:
+        LookupError: If the encoding is unknown
+    """
+    for mark, marked_encoding in BYTE_ORDER_MARKS:
+        if data.startswith(mark):
+            return marked_encoding
+    name = codecs.lookup(encoding).name
+    return "utf-8" if name == "utf-8-sig" else name
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """
+    Check whether markdown syntax can be found in the raw bytes of an encoding.
+
+    That is the case for UTF-8, whose multi-byte sequences never contain
+    ASCII bytes, and for single-byte encodings that agree with ASCII.
+
+    Args:
+        encoding: A codec name
+
+    Returns:
+        True if the tokenizer can scan bytes in this encoding directly
+    """
+    name = codecs.lookup(encoding).name
+    if name in ("utf-8", "utf-8-sig"):
+        return True
+    try:
+        if _ASCII.decode(name) != _ASCII.decode("ascii"):
+            return False
+        return len(bytes(range(256)).decode(name, "replace")) == 256
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+
+def prepare_content(
+    data: bytes, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Tuple[Union[str, bytes], str]:
+    """
+    Prepare the raw content of a markdown file for tokenizing.
+
+    Content in an ASCII-compatible encoding is returned as is, so only the
+    text of the events is decoded. Anything else, such as UTF-16 and UTF-32
+    files, is decoded in full.
+
+    Args:
+        data: The raw content of the markdown file
+        encoding: Encoding to assume when the file has no byte order mark
+        errors: Error handler for undecodable bytes, as in bytes.decode
+
+    Returns:
+        Tuple of (the raw bytes or the decoded text, the detected encoding)
+
+    Raises:
+        LookupError: If the encoding is unknown
+        UnicodeDecodeError: If a full decode fails with the "strict" handler
+    """
+    encoding = detect_encoding(data, encoding)
+    if is_ascii_compatible(encoding):
+        return data, encoding
+    return data.decode(encoding, errors), encoding
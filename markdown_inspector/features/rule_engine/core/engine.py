@@ -0,0 +1,181 @@
+"""
+Rule engine module for Markdown Inspector.
+Runs every enabled rule plugin over a single tokenizer pass of a document.
+"""
+
+import sys
+import time
+from typing import Any, Dict, List, Optional, Type, Union
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+)
+from markdown_inspector.features.rule_engine.core.plugin import (
+    ERROR,
+    FileContext,
+    RulePlugin,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import MarkdownTokenizer
+
+# Entry point group third-party rule plugins register under
+ENTRY_POINT_GROUP = "markdown_inspector.rules"
+
+# Entry points that failed to load, so each is only reported once
+_failed_entry_points = set()
+
+
+def builtin_plugins() -> List[Type[RulePlugin]]:
+    """
+    Return the plugins shipped with the package.
+
+    They are imported here rather than at module level because the feature
+    modules defining them import the rule engine themselves.
+
+    Returns:
+        The built-in plugin classes, available even when the package is not
+        installed and its entry points are unknown
+    """
+    from markdown_inspector.features.header_validation.core.plugin import (
+        HeaderValidationRule,
+    )
+    from markdown_inspector.features.toc.core.plugin import TocRule
+
+    return [HeaderValidationRule, TocRule]
+
+
+def discover_plugins() -> List[Type[RulePlugin]]:
+    """
+    Find the rule plugins available to the engine.
+
+    Returns:
+        The built-in plugins followed by plugins registered under the
+        "markdown_inspector.rules" entry point group, without duplicate names.
+        A plugin that fails to load is skipped with a warning on stderr
+    """
+    plugins = builtin_plugins()
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # pragma: no cover - Python 3.7
+        return plugins
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        group = found.select(group=ENTRY_POINT_GROUP)
+    else:  # pragma: no cover - Python < 3.10
+        group = found.get(ENTRY_POINT_GROUP, [])
+
+    names = {plugin.name for plugin in plugins}
+    for entry_point in group:
+        try:
+            plugin = entry_point.load()
+        except Exception as e:
+            if entry_point.name not in _failed_entry_points:
+                _failed_entry_points.add(entry_point.name)
+                print(
+                    f"Warning: skipping rule plugin '{entry_point.name}': {e}",
+                    file=sys.stderr,
+                )
+            continue
+        if plugin.name not in names:
+            names.add(plugin.name)
+            plugins.append(plugin)
+    return plugins
+
+
+class RuleEngine:
+    """Inspects documents with all enabled rule plugins in one scan."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        plugin_classes: Optional[List[Type[RulePlugin]]] = None,
+    ):
+        """
+        Initialize the engine and the plugins enabled for a configuration.
+
+        Args:
+            config: The configuration dictionary
+            plugin_classes: Plugins to use instead of the discovered ones
+        """
+        if plugin_classes is None:
+            plugin_classes = discover_plugins()
+        self.config = config
+        self.plugins = [
+            plugin_class(config)
+            for plugin_class in plugin_classes
+            if plugin_class.applies_to(config)
+        ]
+
+        self.subscribers: Dict[str, List[RulePlugin]] = {}
+        for plugin in self.plugins:
+            for event_type in plugin.events:
+                self.subscribers.setdefault(event_type, []).append(plugin)
+        self.tokenizer = MarkdownTokenizer(self.subscribers)
+
+    def get_plugin(self, name: str) -> Optional[RulePlugin]:
+        """
+        Find an enabled plugin by name.
+
+        Args:
+            name: Name of the plugin
+
+        Returns:
+            The plugin, or None if it is not enabled
+        """
+        for plugin in self.plugins:
+            if plugin.name == name:
+                return plugin
+        return None
+
+    def run(
+        self,
+        content: Union[str, bytes],
+        path: Optional[str] = None,
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> Dict[str, Any]:
+        """
+        Inspect a document.
+
+        The document is tokenized once and each event is sent only to the
+        plugins subscribed to its type. Time spent in each plugin is measured
+        separately; the remainder is reported as "tokenize".
+
+        Args:
+            content: The content of the markdown file, as text or as raw bytes
+                in an ASCII-compatible encoding
+            path: Path of the markdown file, if it has one
+            encoding: Encoding of raw bytes content
+            errors: Error handler for undecodable bytes, as in bytes.decode
+
+        Returns:
+            Dictionary with the success flag (no error findings), the findings
+            of all plugins and the seconds spent per rule
+        """
+        started = time.perf_counter()
+        context = FileContext(path, self.config)
+        timings = {plugin.name: 0.0 for plugin in self.plugins}
+
+        for plugin in self.plugins:
+            plugin_started = time.perf_counter()
+            plugin.start(context)
+            timings[plugin.name] += time.perf_counter() - plugin_started
+
+        for event in self.tokenizer.tokenize(content, encoding, errors):
+            for plugin in self.subscribers[event["type"]]:
+                plugin_started = time.perf_counter()
+                plugin.handle(event, context)
+                timings[plugin.name] += time.perf_counter() - plugin_started
+
+        findings = []
+        for plugin in self.plugins:
+            plugin_started = time.perf_counter()
+            findings.extend(plugin.finish(context))
+            timings[plugin.name] += time.perf_counter() - plugin_started
+
+        timings["tokenize"] = (time.perf_counter() - started) - sum(timings.values())
+        return {
+            "success": not any(f["severity"] == ERROR for f in findings),
+            "findings": findings,
+            "timings": timings,
+        }
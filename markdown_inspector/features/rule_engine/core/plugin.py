@@ -0,0 +1,92 @@
+"""
+Rule plugin module for Markdown Inspector.
+Defines the interface rule plugins implement and the per-file context they share.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional
+
+ERROR = "error"
+INFO = "info"
+
+
+def make_finding(
+    rule: str, message: str, severity: str = ERROR, line: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Build a structured finding.
+
+    Args:
+        rule: Name of the rule reporting the finding
+        message: Human-readable description
+        severity: ERROR for violations, INFO for everything else
+        line: 1-based line number the finding refers to, if any
+
+    Returns:
+        Dictionary with rule, severity, message and line
+    """
+    return {"rule": rule, "severity": severity, "message": message, "line": line}
+
+
+class FileContext:
+    """State shared by all plugins while one file is inspected."""
+
+    def __init__(self, path: Optional[str], config: Dict[str, Any]):
+        """
+        Initialize the context.
+
+        Args:
+            path: Path of the inspected file, if it has one
+            config: The configuration dictionary
+        """
+        self.path = path
+        self.config = config
+        self.data: Dict[str, Any] = {}
+
+
+class RulePlugin:
+    """Base class for rules run by the rule engine."""
+
+    # Unique name used in findings and timings
+    name = "rule"
+    # Event types the plugin is sent; see the tokenizer module
+    events: FrozenSet[str] = frozenset()
+    # Whether findings depend on FileContext.path, so that files with
+    # identical content cannot share them in batch mode
+    uses_path = False
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the plugin once per configuration.
+
+        Args:
+            config: The configuration dictionary
+        """
+        self.config = config
+
+    @classmethod
+    def applies_to(cls, config: Dict[str, Any]) -> bool:
+        """
+        Check whether the plugin is enabled for a configuration.
+
+        Args:
+            config: The configuration dictionary
+
+        Returns:
+            True if the plugin should run
+        """
+        return True
+
+    def start(self, context: FileContext) -> None:
+        """Prepare for a new file."""
+
+    def handle(self, event: Dict[str, Any], context: FileContext) -> None:
+        """Process one subscribed event of the file."""
+
+    def finish(self, context: FileContext) -> List[Dict[str, Any]]:
+        """
+        Complete the file.
+
+        Returns:
+            Findings for the file, built with make_finding
+        """
+        return []
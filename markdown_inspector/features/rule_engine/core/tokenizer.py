@@ -0,0 +1,366 @@
+"""
+Tokenizer module for Markdown Inspector.
+Scans a markdown document once and emits the events rule plugins subscribe to.
+"""
+
+import io
+import re
+import codecs
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from markdown_inspector.features.rule_engine.core.encoding import (
+    DEFAULT_ENCODING,
+    DEFAULT_ERRORS,
+)
+
+HEADING = "heading"
+FENCE = "fence"
+LINK = "link"
+FRONT_MATTER = "front_matter"
+LINE = "line"
+
+EVENT_TYPES = (HEADING, FENCE, LINK, FRONT_MATTER, LINE)
+
+# Same header syntax as HeaderValidator.parse_markdown_headers, for one line
+HEADING_SYNTAX = r"(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?$"
+FENCE_SYNTAX = r" {0,3}(`{3,}|~{3,})(.*)$"
+LINK_SYNTAX = r"(!?)\[([^\]]*)\]\(\s*<?([^\s)>]*)>?(?:\s+[^)]*)?\)"
+
+# Lines that can start a heading or a fence, used when no other lines matter
+CANDIDATE_SYNTAX = r"^(?:#{1,6}[ \t]| {0,3}(?:`{3}|~{3})).*$"
+
+HEADING_PATTERN = re.compile(HEADING_SYNTAX)
+FENCE_PATTERN = re.compile(FENCE_SYNTAX)
+LINK_PATTERN = re.compile(LINK_SYNTAX)
+CANDIDATE_PATTERN = re.compile(CANDIDATE_SYNTAX, re.MULTILINE)
+
+# The same patterns for the raw bytes of ASCII-compatible encodings
+HEADING_BYTES_PATTERN = re.compile(HEADING_SYNTAX.encode("ascii"))
+FENCE_BYTES_PATTERN = re.compile(FENCE_SYNTAX.encode("ascii"))
+LINK_BYTES_PATTERN = re.compile(LINK_SYNTAX.encode("ascii"))
+CANDIDATE_BYTES_PATTERN = re.compile(CANDIDATE_SYNTAX.encode("ascii"), re.MULTILINE)
+
+# Lines of YAML front matter: "key: value", indented, list, comment and blank
+FRONT_MATTER_LINE_PATTERN = re.compile(
+    r"(?:[\w.-]+|\"[^\"]*\"|'[^']*')[ \t]*:(?:[ \t].*)?|[ \t].*|-(?:[ \t].*)?|#.*|"
+)
+
+# Comment lines that read like a markdown heading
+HEADING_LIKE_PATTERN = re.compile(r"#{1,6}[ \t]+\S")
+
+
+def is_front_matter_line(line: str, previous_line: str = "") -> bool:
+    """
+    Check whether a line can belong to a YAML front matter block.
+
+    A document can also start with a thematic break ("---"), so a block is
+    only front matter if all its lines look like YAML. A comment that reads
+    like a heading and is followed by a blank line is taken as a heading.
+
+    Args:
+        line: The line without its line ending and trailing whitespace
+        previous_line: The line before it in the block, stripped the same way
+
+    Returns:
+        True if the line fits in front matter
+    """
+    if not FRONT_MATTER_LINE_PATTERN.fullmatch(line):
+        return False
+    return bool(line) or not HEADING_LIKE_PATTERN.match(previous_line)
+
+
+def parse_front_matter_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a top-level "key: value" line of front matter.
+
+    Args:
+        line: The line without its line ending
+
+    Returns:
+        Tuple of (key, value) with surrounding quotes removed from the value,
+        or None for indented, comment, list and other lines
+    """
+    if line[:1] in (" ", "\t", "#", "-") or ":" not in line:
+        return None
+
+    key, _, value = line.partition(":")
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    return key.strip(), value
+
+
+class _Syntax:
+    """The patterns and literals the tokenizer uses for text or raw bytes."""
+
+    def __init__(self, binary: bool):
+        def literal(text: str) -> Any:
+            return text.encode("ascii") if binary else text
+
+        self.heading = HEADING_BYTES_PATTERN if binary else HEADING_PATTERN
+        self.fence = FENCE_BYTES_PATTERN if binary else FENCE_PATTERN
+        self.link = LINK_BYTES_PATTERN if binary else LINK_PATTERN
+        self.candidate = CANDIDATE_BYTES_PATTERN if binary else CANDIDATE_PATTERN
+        self.byte_order_mark = codecs.BOM_UTF8 if binary else "\ufeff"
+        self.lines = io.BytesIO if binary else io.StringIO
+        self.newline = literal("\n")
+        self.carriage_return = literal("\r")
+        self.hash = literal("#")
+        self.link_start = literal("](")
+        self.front_matter_start = literal("---")
+        self.front_matter_ends = (literal("---"), literal("..."))
+
+
+_TEXT_SYNTAX = _Syntax(binary=False)
+_BYTES_SYNTAX = _Syntax(binary=True)
+
+
+class MarkdownTokenizer:
+    """Emits heading, fence, link, front matter and line events in one pass."""
+
+    def __init__(self, events: Iterable[str]):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            events: Event types to emit; work for other types is skipped
+
+        Raises:
+            ValueError: If an event type is unknown
+        """
+        self.events = frozenset(events)
+        unknown = self.events.difference(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}")
+
+    def tokenize(
+        self,
+        content: Union[str, bytes],
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Emit the events of a document in document order.
+
+        Every event has a "type" and a 1-based "line". Headings carry "title",
+        "level", "in_fence" and the "offset" of their line in the content;
+        fences "marker", "info" and "opening"; links "text", "target" and
+        "image"; front matter its "values" and "end_line"; lines their "text"
+        and "in_fence". Headings inside code fences are still emitted, flagged
+        with "in_fence", while links are only emitted outside fences. Front
+        matter lines are never headings.
+
+        Raw bytes in an ASCII-compatible encoding are scanned as they are and
+        only the text of the emitted events is decoded, so offsets are byte
+        offsets. A leading byte order mark is skipped, and a carriage return
+        ending a line is not part of its text.
+
+        Args:
+            content: The content of the markdown file, as text or raw bytes
+            encoding: Encoding of raw bytes content
+            errors: Error handler for undecodable bytes, as in bytes.decode
+
+        Yields:
+            Event dictionaries
+
+        Raises:
+            UnicodeDecodeError: If the text of an event cannot be decoded with
+                the "strict" error handler. Its positions are offsets in the
+                content
+        """
+        if isinstance(content, bytes):
+            syntax = _BYTES_SYNTAX
+
+            def decode(text: Any, position: int) -> str:
+                try:
+                    return text.decode(encoding, errors)
+                except UnicodeDecodeError as e:
+                    # Report the position in the document, not in the text
+                    raise UnicodeDecodeError(
+                        e.encoding,
+                        content,
+                        position + e.start,
+                        position + e.end,
+                        e.reason,
+                    ) from None
+
+        else:
+            syntax = _TEXT_SYNTAX
+
+            def decode(text: Any, position: int) -> str:
+                return text
+
+        start = 0
+        if content.startswith(syntax.byte_order_mark):
+            start = len(syntax.byte_order_mark)
+        line_number = 1
+        front_matter = self._front_matter(content, start, syntax, decode)
+        if front_matter is not None:
+            values, start, end_line = front_matter
+            if FRONT_MATTER in self.events:
+                yield {
+                    "type": FRONT_MATTER,
+                    "line": 1,
+                    "values": values,
+                    "end_line": end_line,
+                }
+            line_number = end_line + 1
+
+        if LINE in self.events or LINK in self.events:
+            lines = self._all_lines(content, start, line_number, syntax)
+        else:
+            lines = self._candidate_lines(content, start, line_number, syntax)
+
+        fence = None
+        for number, offset, text in lines:
+            fence_match = syntax.fence.match(text)
+            delimiter = fence_match is not None and (
+                fence is None
+                or (
+                    fence_match.group(1)[0] == fence[0]
+                    and len(fence_match.group(1)) >= len(fence)
+                    and not fence_match.group(2).strip()
+                )
+            )
+            if delimiter:
+                opening = fence is None
+                marker = fence_match.group(1)
+                fence = marker if opening else None
+                if FENCE in self.events:
+                    yield {
+                        "type": FENCE,
+                        "line": number,
+                        "marker": decode(marker, offset + fence_match.start(1)),
+                        "info": (
+                            decode(
+                                fence_match.group(2).strip(),
+                                offset
+                                + fence_match.end(2)
+                                - len(fence_match.group(2).lstrip()),
+                            )
+                            if opening
+                            else ""
+                        ),
+                        "opening": opening,
+                    }
+            elif HEADING in self.events and text.startswith(syntax.hash):
+                heading_match = syntax.heading.match(text)
+                if heading_match is not None:
+                    yield {
+                        "type": HEADING,
+                        "line": number,
+                        "title": decode(
+                            heading_match.group(2).strip(),
+                            offset + heading_match.start(2),
+                        ),
+                        "level": len(heading_match.group(1)),
+                        "in_fence": fence is not None,
+                        "offset": offset,
+                    }
+
+            if LINK in self.events and fence is None and syntax.link_start in text:
+                for link_match in syntax.link.finditer(text):
+                    yield {
+                        "type": LINK,
+                        "line": number,
+                        "text": decode(
+                            link_match.group(2), offset + link_match.start(2)
+                        ),
+                        "target": decode(
+                            link_match.group(3), offset + link_match.start(3)
+                        ),
+                        "image": bool(link_match.group(1)),
+                    }
+
+            if LINE in self.events:
+                yield {
+                    "type": LINE,
+                    "line": number,
+                    "text": decode(text, offset),
+                    "in_fence": fence is not None and not delimiter,
+                }
+
+    @staticmethod
+    def _front_matter(
+        content: Union[str, bytes],
+        start: int,
+        syntax: _Syntax,
+        decode: Callable[[Any, int], str],
+    ) -> Optional[Tuple[Dict[str, str], int, int]]:
+        """
+        Find the front matter block at the start of a document.
+
+        Returns:
+            Tuple of (values, offset after the block, line number of its
+            closing delimiter), or None if the document has no front matter,
+            including when its first line is a thematic break
+        """
+        if not content.startswith(syntax.front_matter_start, start):
+            return None
+        lines = syntax.lines(content)
+        lines.seek(start)
+        first_line = lines.readline()
+        if first_line.rstrip() != syntax.front_matter_start:
+            return None
+
+        values: Dict[str, str] = {}
+        offset = start + len(first_line)
+        previous_line = ""
+        for line_number, line in enumerate(lines, 2):
+            line_offset = offset
+            offset += len(line)
+            stripped = line.rstrip()
+            if stripped in syntax.front_matter_ends:
+                return values, offset, line_number
+            text = decode(stripped, line_offset)
+            if not is_front_matter_line(text, previous_line):
+                # A thematic break rather than front matter
+                return None
+            previous_line = text
+            entry = parse_front_matter_line(text)
+            if entry is not None:
+                values[entry[0]] = entry[1]
+        return None
+
+    @staticmethod
+    def _all_lines(
+        content: Union[str, bytes], start: int, line_number: int, syntax: _Syntax
+    ) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (line number, offset, text) for every line from an offset."""
+        lines = syntax.lines(content)
+        lines.seek(start)
+        offset = start
+        for number, line in enumerate(lines, line_number):
+            text = line.rstrip(syntax.newline)
+            if text.endswith(syntax.carriage_return):
+                text = text[:-1]
+            yield number, offset, text
+            offset += len(line)
+
+    @staticmethod
+    def _candidate_lines(
+        content: Union[str, bytes], start: int, line_number: int, syntax: _Syntax
+    ) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (line number, offset, text) only for lines that may be headings or fences."""
+        position = start
+        if start and not content.startswith(syntax.newline, start - 1):
+            # "^" only matches at line starts, so the line after a byte order
+            # mark is matched on its own
+            end = content.find(syntax.newline, start)
+            end = len(content) if end == -1 else end
+            text = content[start:end]
+            if syntax.candidate.match(text) is not None:
+                if text.endswith(syntax.carriage_return):
+                    text = text[:-1]
+                yield line_number, start, text
+            if end == len(content):
+                return
+            position = end
+            start = end + 1
+
+        for match in syntax.candidate.finditer(content, start):
+            line_number += content.count(syntax.newline, position, match.start())
+            position = match.start()
+            text = match.group(0)
+            if text.endswith(syntax.carriage_return):
+                text = text[:-1]
+            yield line_number, position, text
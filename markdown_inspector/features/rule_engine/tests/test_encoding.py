@@ -0,0 +1,50 @@
+"""
+Tests for the encoding module.
+"""
+
+import codecs
+import unittest
+
+from markdown_inspector.features.rule_engine.core.encoding import (
+    detect_encoding,
+    is_ascii_compatible,
+    prepare_content,
+)
+
+
+class TestEncoding(unittest.TestCase):
+    """Test cases for encoding detection and content preparation."""
+
+    def test_byte_order_marks(self):
+        """Test that a byte order mark overrides the given encoding."""
+        self.assertEqual(detect_encoding(codecs.BOM_UTF8 + b"# A", "latin-1"), "utf-8")
+        self.assertEqual(detect_encoding("# A".encode("utf-16")), "utf-16")
+        self.assertEqual(detect_encoding("# A".encode("utf-32")), "utf-32")
+
+    def test_given_encoding(self):
+        """Test that files without a byte order mark use the given encoding."""
+        self.assertEqual(detect_encoding(b"# A"), "utf-8")
+        self.assertEqual(detect_encoding(b"# A", "Latin-1"), "iso8859-1")
+        self.assertEqual(detect_encoding(b"# A", "utf-8-sig"), "utf-8")
+        with self.assertRaises(LookupError):
+            detect_encoding(b"# A", "no-such-encoding")
+
+    def test_ascii_compatible(self):
+        """Test which encodings can be tokenized as raw bytes."""
+        self.assertTrue(is_ascii_compatible("utf-8"))
+        self.assertTrue(is_ascii_compatible("latin-1"))
+        self.assertTrue(is_ascii_compatible("cp1252"))
+        self.assertFalse(is_ascii_compatible("utf-16"))
+        self.assertFalse(is_ascii_compatible("utf-32"))
+
+    def test_prepare_content(self):
+        """Test that only incompatible encodings are decoded in full."""
+        data = "# Überblick\n".encode("utf-8")
+        self.assertEqual(prepare_content(data), (data, "utf-8"))
+
+        content, encoding = prepare_content("# Überblick\n".encode("utf-16"))
+        self.assertEqual((content, encoding), ("# Überblick\n", "utf-16"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for the rule engine module.
+"""
+
+import io
+import unittest
+from unittest.mock import Mock, patch
+
+from markdown_inspector.features.header_validation.core.plugin import (
+    HeaderValidationRule,
+)
+from markdown_inspector.features.rule_engine.core import engine as engine_module
+from markdown_inspector.features.rule_engine.core.engine import (
+    RuleEngine,
+    discover_plugins,
+)
+from markdown_inspector.features.rule_engine.core.plugin import (
+    RulePlugin,
+    make_finding,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import LINK
+from markdown_inspector.features.toc.core.plugin import TocRule
+
+
+class LinkCountRule(RulePlugin):
+    """Test plugin reporting documents with too many links."""
+
+    name = "link_count"
+    events = frozenset([LINK])
+
+    @classmethod
+    def applies_to(cls, config):
+        return "max_links" in config
+
+    def start(self, context):
+        context.data["links"] = 0
+
+    def handle(self, event, context):
+        context.data["links"] += 1
+
+    def finish(self, context):
+        if context.data["links"] > self.config["max_links"]:
+            return [make_finding(self.name, "Too many links", line=None)]
+        return []
+
+
+class TestRuleEngine(unittest.TestCase):
+    """Test cases for the RuleEngine."""
+
+    def setUp(self):
+        """Set up a configuration used by both plugins."""
+        self.config = {"headings": [{"title": "Guide", "level": 1}], "max_links": 1}
+        self.engine = RuleEngine(self.config, [HeaderValidationRule, LinkCountRule])
+
+    def test_findings_from_all_plugins(self):
+        """Test that every plugin reports findings from one scan."""
+        result = self.engine.run("# Guide\n[a](a.md) [b](b.md)\n")
+
+        self.assertFalse(result["success"])
+        self.assertEqual(
+            result["findings"],
+            [
+                {
+                    "rule": "header_validation",
+                    "severity": "info",
+                    "message": "All headers validated successfully",
+                    "line": None,
+                },
+                {
+                    "rule": "link_count",
+                    "severity": "error",
+                    "message": "Too many links",
+                    "line": None,
+                },
+            ],
+        )
+        self.assertEqual(
+            set(result["timings"]), {"header_validation", "link_count", "tokenize"}
+        )
+
+    def test_subscriptions(self):
+        """Test that plugins only get the events they subscribe to."""
+        self.assertEqual(set(self.engine.subscribers), {"heading", "link"})
+        self.assertEqual(self.engine.tokenizer.events, {"heading", "link"})
+
+    def test_disabled_plugin(self):
+        """Test that plugins not applying to a configuration are skipped."""
+        engine = RuleEngine({"headings": []}, [HeaderValidationRule, LinkCountRule])
+
+        self.assertIsNone(engine.get_plugin("link_count"))
+        self.assertEqual(engine.tokenizer.events, {"heading"})
+
+    def test_leading_thematic_break(self):
+        """Test that headings after a leading thematic break are validated."""
+        engine = RuleEngine(self.config, [HeaderValidationRule])
+
+        result = engine.run("---\n# Guide\n\ntext\n\n---\n## More\n")
+
+        self.assertTrue(result["success"])
+
+    def test_broken_plugin_is_skipped(self):
+        """Test that a third-party plugin failing to load is skipped with a warning."""
+        broken = Mock(load=Mock(side_effect=ImportError("No module named 'gone'")))
+        broken.name = "broken"
+        working = Mock(load=Mock(return_value=LinkCountRule))
+        working.name = "link_count"
+        found = Mock(select=Mock(return_value=[broken, working]))
+
+        with patch("importlib.metadata.entry_points", return_value=found), patch.object(
+            engine_module, "_failed_entry_points", set()
+        ), patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            plugins = discover_plugins()
+            discover_plugins()
+
+        self.assertIn(LinkCountRule, plugins)
+        self.assertIn(HeaderValidationRule, plugins)
+        self.assertEqual(
+            stderr.getvalue(),
+            "Warning: skipping rule plugin 'broken': No module named 'gone'\n",
+        )
+
+    def test_builtin_plugins_are_discovered(self):
+        """Test that the built-in rules are always available."""
+        plugins = discover_plugins()
+        self.assertIn(HeaderValidationRule, plugins)
+        self.assertIn(TocRule, plugins)
+
+
+if __name__ == "__main__":
+    unittest.main()
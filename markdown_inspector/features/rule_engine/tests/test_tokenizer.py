@@ -0,0 +1,172 @@
+"""
+Tests for the tokenizer module.
+"""
+
+import unittest
+
+from markdown_inspector.features.rule_engine.core.tokenizer import (
+    EVENT_TYPES,
+    FENCE,
+    FRONT_MATTER,
+    HEADING,
+    LINE,
+    LINK,
+    MarkdownTokenizer,
+)
+
+
+class TestMarkdownTokenizer(unittest.TestCase):
+    """Test cases for the MarkdownTokenizer."""
+
+    def setUp(self):
+        """Set up a document with every kind of event."""
+        self.content = (
+            "---\n"
+            "doc-type: user\n"
+            "# not a heading\n"
+            "---\n"
+            "# Title #\n"
+            "See [the guide](docs/guide.md) and ![logo](logo.png).\n"
+            "```bash\n"
+            "# comment\n"
+            "[not](a-link)\n"
+            "```\n"
+            "## Section\n"
+        )
+
+    def _events(self, event_types):
+        """Helper to tokenize the document."""
+        return list(MarkdownTokenizer(event_types).tokenize(self.content))
+
+    def test_all_events(self):
+        """Test the events emitted when every type is requested."""
+        events = self._events(EVENT_TYPES)
+        by_type = {}
+        for event in events:
+            by_type.setdefault(event["type"], []).append(event)
+
+        self.assertEqual(
+            by_type[FRONT_MATTER],
+            [
+                {
+                    "type": FRONT_MATTER,
+                    "line": 1,
+                    "values": {"doc-type": "user"},
+                    "end_line": 4,
+                }
+            ],
+        )
+        self.assertEqual(
+            [
+                (e["line"], e["title"], e["level"], e["in_fence"])
+                for e in by_type[HEADING]
+            ],
+            [
+                (5, "Title", 1, False),
+                (8, "comment", 1, True),
+                (11, "Section", 2, False),
+            ],
+        )
+        self.assertEqual(
+            [(e["line"], e["text"], e["target"], e["image"]) for e in by_type[LINK]],
+            [(6, "the guide", "docs/guide.md", False), (6, "logo", "logo.png", True)],
+        )
+        self.assertEqual(
+            [(e["line"], e["opening"], e["info"]) for e in by_type[FENCE]],
+            [(7, True, "bash"), (10, False, "")],
+        )
+        self.assertEqual([e["line"] for e in by_type[LINE]], list(range(5, 12)))
+        self.assertEqual([e["line"] for e in by_type[LINE] if e["in_fence"]], [8, 9])
+
+    def test_only_requested_events(self):
+        """Test that the fast path for headings gives the same headings."""
+        headings = self._events([HEADING])
+        all_headings = [e for e in self._events(EVENT_TYPES) if e["type"] == HEADING]
+
+        self.assertEqual(headings, all_headings)
+
+    def test_heading_offsets(self):
+        """Test that headings carry the offset of their line."""
+        for event in self._events([HEADING]):
+            line = self.content[event["offset"] :].split("\n", 1)[0]
+            self.assertTrue(line.startswith("#"))
+            self.assertIn(event["title"], line)
+
+    def test_bytes_content(self):
+        """Test that raw bytes give the same events as text."""
+        text_events = self._events(EVENT_TYPES)
+        tokenizer = MarkdownTokenizer(EVENT_TYPES)
+        byte_events = list(tokenizer.tokenize(self.content.encode("utf-8")))
+
+        self.assertEqual(byte_events, text_events)
+
+    def test_byte_offsets(self):
+        """Test that heading offsets in raw bytes count bytes."""
+        data = "# Café\n\n## Überblick\n".encode("utf-8")
+
+        events = list(MarkdownTokenizer([HEADING]).tokenize(data))
+
+        self.assertEqual([e["title"] for e in events], ["Café", "Überblick"])
+        self.assertEqual(data[events[1]["offset"] :], "## Überblick\n".encode())
+
+    def test_byte_order_mark_and_crlf(self):
+        """Test that a BOM is skipped and CRLF line endings are not in the text."""
+        data = b"\xef\xbb\xbf---\r\ndoc-type: user\r\n---\r\n# Title ##\r\n"
+
+        events = list(MarkdownTokenizer([FRONT_MATTER, HEADING, LINE]).tokenize(data))
+
+        self.assertEqual(events[0]["values"], {"doc-type": "user"})
+        self.assertEqual(events[1]["title"], "Title")
+        self.assertEqual(events[1]["offset"], data.index(b"# Title"))
+        self.assertEqual(events[2]["text"], "# Title ##")
+
+        # Without front matter the heading right after the mark is found
+        headings = MarkdownTokenizer([HEADING]).tokenize(b"\xef\xbb\xbf# Title\r\n")
+        self.assertEqual([(e["title"], e["offset"]) for e in headings], [("Title", 3)])
+
+    def test_decoding_errors(self):
+        """Test that only event text is decoded, with the given error handler."""
+        data = b"# Caf\xe9\n\nBody with a stray \xff byte\n"
+        tokenizer = MarkdownTokenizer([HEADING])
+
+        self.assertEqual(next(tokenizer.tokenize(data))["title"], "Caf\ufffd")
+        self.assertEqual(next(tokenizer.tokenize(data, "latin-1"))["title"], "Café")
+        with self.assertRaises(UnicodeDecodeError) as raised:
+            next(tokenizer.tokenize(data, errors="strict"))
+        # The position is reported in the document, not in the title
+        self.assertEqual(raised.exception.start, data.index(b"\xe9"))
+
+        # The undecodable body byte is never decoded
+        clean = b"# Title\n\nBody with a stray \xff byte\n"
+        self.assertEqual(len(list(tokenizer.tokenize(clean, errors="strict"))), 1)
+
+    def test_thematic_break_is_not_front_matter(self):
+        """Test that a leading thematic break does not hide the headings after it."""
+        tokenizer = MarkdownTokenizer([FRONT_MATTER, HEADING])
+        documents = [
+            "---\n# Doc\n\ntext\n\n---\n## More\n",
+            "---\n# Doc\n\n---\n## More\n",
+        ]
+
+        for content in documents:
+            events = list(tokenizer.tokenize(content))
+            self.assertEqual([e["type"] for e in events], [HEADING, HEADING])
+            self.assertEqual(events[0]["title"], "Doc")
+
+        # YAML comments, lists and indented values are still front matter
+        events = list(
+            tokenizer.tokenize(
+                "---\n# comment\ntitle: Guide\ntags:\n  - a\n- b\n\n---\n# Guide\n"
+            )
+        )
+        self.assertEqual(events[0]["values"], {"title": "Guide", "tags": ""})
+        self.assertEqual([e["type"] for e in events], [FRONT_MATTER, HEADING])
+
+    def test_unknown_event_type(self):
+        """Test that unknown event types are rejected."""
+        with self.assertRaises(ValueError):
+            MarkdownTokenizer(["table"])
+
+
+if __name__ == "__main__":
+    unittest.main()
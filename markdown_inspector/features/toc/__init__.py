@@ -0,0 +1,12 @@
+"""
+Table of contents feature for markdown files.
+"""
+
+from markdown_inspector.features.toc.core.plugin import TocRule
+from markdown_inspector.features.toc.core.toc import (
+    github_slug,
+    heading_anchors,
+    render_toc,
+)
+
+__all__ = ["TocRule", "github_slug", "heading_anchors", "render_toc"]
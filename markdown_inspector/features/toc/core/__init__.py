@@ -0,0 +1,3 @@
+"""
+Core functionality for table of contents feature.
+"""
@@ -0,0 +1,145 @@
+"""
+Table of contents rule plugin for Markdown Inspector.
+Checks the table of contents of a document against its headings.
+"""
+
+from typing import Any, Dict, List
+from markdown_inspector.features.rule_engine.core.plugin import (
+    INFO,
+    FileContext,
+    RulePlugin,
+    make_finding,
+)
+from markdown_inspector.features.rule_engine.core.tokenizer import HEADING, LINK
+from markdown_inspector.features.toc.core.toc import (
+    heading_anchors,
+    is_toc_heading,
+    toc_entries,
+    toc_options,
+)
+
+
+class TocRule(RulePlugin):
+    """Checks that the table of contents links every heading and nothing else."""
+
+    name = "toc"
+    events = frozenset([HEADING, LINK])
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the rule.
+
+        Args:
+            config: The configuration dictionary
+        """
+        super().__init__(config)
+        self.options = toc_options(config)
+
+    @classmethod
+    def applies_to(cls, config: Dict[str, Any]) -> bool:
+        """Run only for configurations with a "toc" section."""
+        return toc_options(config) is not None
+
+    def start(self, context: FileContext) -> None:
+        """Start collecting headings and table of contents links."""
+        context.data["toc"] = {
+            "headings": [],
+            "entries": [],
+            "line": None,
+            "collecting": False,
+        }
+
+    def handle(self, event: Dict[str, Any], context: FileContext) -> None:
+        """Collect a heading outside code fences, or a link of the table of contents."""
+        toc = context.data["toc"]
+        if event["type"] == LINK:
+            if toc["collecting"] and event["target"].startswith("#"):
+                toc["entries"].append(event)
+            return
+        if event["in_fence"]:
+            return
+
+        toc["headings"].append(event)
+        toc["collecting"] = toc["line"] is None and is_toc_heading(
+            event["title"], self.options
+        )
+        if toc["collecting"]:
+            toc["line"] = event["line"]
+
+    def finish(self, context: FileContext) -> List[Dict[str, Any]]:
+        """Compare the table of contents entries with the headings."""
+        toc = context.data["toc"]
+        if toc["line"] is None:
+            if self.options["required"]:
+                message = f"Missing table of contents: '{self.options['title']}'"
+                return [make_finding(self.name, message)]
+            return []
+
+        anchors = set(heading_anchors([h["title"] for h in toc["headings"]]))
+        expected = {
+            anchor: (position, heading)
+            for position, (heading, anchor) in enumerate(
+                toc_entries(toc["headings"], self.options)
+            )
+        }
+
+        findings = []
+        listed = set()
+        previous_position = -1
+        for entry in toc["entries"]:
+            anchor = entry["target"][1:]
+            listed.add(anchor)
+            if anchor not in anchors:
+                findings.append(
+                    make_finding(
+                        self.name,
+                        f"Table of contents entry '{entry['text']}' links to a "
+                        f"missing heading '#{anchor}'",
+                        line=entry["line"],
+                    )
+                )
+                continue
+            if anchor not in expected:
+                continue
+
+            position, heading = expected[anchor]
+            if entry["text"] != heading["title"]:
+                findings.append(
+                    make_finding(
+                        self.name,
+                        f"Table of contents entry '{entry['text']}' does not "
+                        f"match heading '{heading['title']}'",
+                        line=entry["line"],
+                    )
+                )
+            if position < previous_position:
+                findings.append(
+                    make_finding(
+                        self.name,
+                        f"Table of contents entry '{entry['text']}' is out of order",
+                        line=entry["line"],
+                    )
+                )
+            previous_position = position
+
+        for anchor, (_, heading) in expected.items():
+            if anchor not in listed:
+                findings.append(
+                    make_finding(
+                        self.name,
+                        f"Heading '{heading['title']}' is missing from the "
+                        "table of contents",
+                        line=heading["line"],
+                    )
+                )
+
+        if not findings:
+            findings.append(
+                make_finding(
+                    self.name,
+                    "Table of contents matches the headings",
+                    INFO,
+                    line=toc["line"],
+                )
+            )
+        return findings
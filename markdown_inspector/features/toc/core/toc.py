@@ -0,0 +1,171 @@
+"""
+Table of contents module for Markdown Inspector.
+Computes heading anchors and renders and locates table of contents lists.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_OPTIONS = {
+    "title": "Table of Contents",
+    "min_level": 2,
+    "max_level": 3,
+    "required": False,
+}
+
+# GitHub drops everything but letters, digits, spaces, hyphens and underscores
+_SLUG_PUNCTUATION = re.compile(r"[^\w\- ]")
+
+# Lines that start a markdown list item
+LIST_ITEM_PATTERN = re.compile(rb"[ \t]*(?:[-*+]|\d+[.)])[ \t]")
+
+
+def toc_options(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Read the table of contents options of a configuration.
+
+    Args:
+        config: The configuration dictionary
+
+    Returns:
+        The "toc" options merged over the defaults, or None if the check is
+        not enabled. "toc" may be true for the defaults or a dictionary
+    """
+    options = config.get("toc", False)
+    if options is False:
+        return None
+    if options is True:
+        options = {}
+    return dict(DEFAULT_OPTIONS, **options)
+
+
+def github_slug(title: str) -> str:
+    """
+    Compute the anchor GitHub generates for a heading, before deduplication.
+
+    Args:
+        title: The header title
+
+    Returns:
+        The title in lower case without punctuation, spaces replaced by hyphens
+    """
+    return _SLUG_PUNCTUATION.sub("", title.strip().lower()).replace(" ", "-")
+
+
+def heading_anchors(titles: List[str]) -> List[str]:
+    """
+    Compute the anchors of the headings of a document.
+
+    Repeated slugs get "-1", "-2" and so on appended, in document order.
+
+    Args:
+        titles: Titles of all headings of the document, in document order
+
+    Returns:
+        The anchor of each heading, without the leading "#"
+    """
+    anchors = []
+    used: Dict[str, int] = {}
+    for title in titles:
+        slug = github_slug(title)
+        anchor = slug
+        while anchor in used:
+            used[slug] += 1
+            anchor = f"{slug}-{used[slug]}"
+        used[anchor] = 0
+        anchors.append(anchor)
+    return anchors
+
+
+def is_toc_heading(title: str, options: Dict[str, Any]) -> bool:
+    """
+    Check whether a heading starts the table of contents.
+
+    Args:
+        title: The header title
+        options: The table of contents options
+
+    Returns:
+        True if the title equals the configured title, ignoring case
+    """
+    return title.strip().casefold() == options["title"].casefold()
+
+
+def toc_entries(
+    headings: List[Dict[str, Any]], options: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    Select the headings that belong in the table of contents.
+
+    Args:
+        headings: Headings outside code fences with "title" and "level", in
+            document order, including the table of contents heading
+        options: The table of contents options
+
+    Returns:
+        List of (heading, anchor) for headings within the configured levels,
+        except the table of contents heading itself
+    """
+    anchors = heading_anchors([heading["title"] for heading in headings])
+    return [
+        (heading, anchor)
+        for heading, anchor in zip(headings, anchors)
+        if options["min_level"] <= heading["level"] <= options["max_level"]
+        and not is_toc_heading(heading["title"], options)
+    ]
+
+
+def render_toc(
+    headings: List[Dict[str, Any]], options: Dict[str, Any], newline: str = "\n"
+) -> str:
+    """
+    Render the table of contents list of a document.
+
+    Args:
+        headings: Headings outside code fences with "title" and "level", in
+            document order, including the table of contents heading
+        options: The table of contents options
+        newline: Line ending to use
+
+    Returns:
+        A nested markdown list linking to each heading, one line per entry
+    """
+    return "".join(
+        f"{'  ' * (heading['level'] - options['min_level'])}"
+        f"- [{heading['title']}](#{anchor}){newline}"
+        for heading, anchor in toc_entries(headings, options)
+    )
+
+
+def find_list(data: bytes, start: int, end: int) -> Tuple[int, int]:
+    """
+    Locate the list of a table of contents section.
+
+    Args:
+        data: The raw content of the markdown file
+        start: Offset of the line after the table of contents heading
+        end: Offset of the next heading, or the end of the document
+
+    Returns:
+        Byte range from the first to the end of the last list item line of
+        the section, or an empty range after its first line if it has no list
+    """
+    first = last = None
+    position = start
+    while position < end:
+        line_end = data.find(b"\n", position, end)
+        line_end = end if line_end == -1 else line_end + 1
+        if LIST_ITEM_PATTERN.match(data, position, line_end):
+            if first is None:
+                first = position
+            last = line_end
+        elif first is not None and not data[position:line_end].strip():
+            # A blank line ends the list
+            break
+        position = line_end
+
+    if first is None:
+        insert_at = data.find(b"\n", start, end)
+        insert_at = start if insert_at == -1 else insert_at + 1
+        return insert_at, insert_at
+    return first, last
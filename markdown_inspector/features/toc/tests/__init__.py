@@ -0,0 +1,3 @@
+"""
+Tests for table of contents feature.
+"""
@@ -0,0 +1,82 @@
+"""
+Tests for the table of contents rule plugin.
+"""
+
+import unittest
+
+from markdown_inspector.features.rule_engine.core.engine import RuleEngine
+from markdown_inspector.features.toc.core.plugin import TocRule
+
+
+class TestTocRule(unittest.TestCase):
+    """Test cases for the TocRule."""
+
+    def _messages(self, content, options=True):
+        """Helper to run only the table of contents rule over a document."""
+        engine = RuleEngine({"toc": options}, [TocRule])
+        result = engine.run(content)
+        return result["success"], [f["message"] for f in result["findings"]]
+
+    def test_matching_toc(self):
+        """Test a table of contents that links every heading in order."""
+        success, messages = self._messages(
+            "# Guide\n"
+            "## Table of Contents\n"
+            "- [Install](#install)\n"
+            "  - [From Source](#from-source)\n"
+            "- [Usage](#usage)\n"
+            "## Install\n"
+            "### From Source\n"
+            "## Usage\n"
+            "```\n"
+            "## Not a heading\n"
+            "```\n"
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(messages, ["Table of contents matches the headings"])
+
+    def test_drifted_toc(self):
+        """Test that stale, missing, renamed and reordered entries are reported."""
+        success, messages = self._messages(
+            "## Table of Contents\n"
+            "- [Usage](#usage)\n"
+            "- [Setup](#install)\n"
+            "- [Removed](#removed)\n"
+            "See also [the FAQ](faq.md).\n"
+            "## Install\n"
+            "## Usage\n"
+            "## FAQ\n"
+            "[Back to top](#table-of-contents)\n"
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(
+            messages,
+            [
+                "Table of contents entry 'Setup' does not match heading 'Install'",
+                "Table of contents entry 'Setup' is out of order",
+                "Table of contents entry 'Removed' links to a missing heading "
+                "'#removed'",
+                "Heading 'FAQ' is missing from the table of contents",
+            ],
+        )
+
+    def test_missing_toc(self):
+        """Test that a table of contents is only required when configured."""
+        self.assertEqual(self._messages("## Install\n"), (True, []))
+
+        success, messages = self._messages(
+            "## Install\n", {"title": "Contents", "required": True}
+        )
+        self.assertFalse(success)
+        self.assertEqual(messages, ["Missing table of contents: 'Contents'"])
+
+    def test_disabled_without_config(self):
+        """Test that the rule only runs for configurations with a toc section."""
+        self.assertIsNone(RuleEngine({"headings": []}).get_plugin("toc"))
+        self.assertIsNotNone(RuleEngine({"toc": True}).get_plugin("toc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for the table of contents module.
+"""
+
+import unittest
+
+from markdown_inspector.features.toc.core.toc import (
+    DEFAULT_OPTIONS,
+    find_list,
+    github_slug,
+    heading_anchors,
+    render_toc,
+    toc_options,
+)
+
+
+class TestToc(unittest.TestCase):
+    """Test cases for anchors, rendering and locating table of contents lists."""
+
+    def test_toc_options(self):
+        """Test that the check is enabled by true or a dictionary of options."""
+        self.assertIsNone(toc_options({}))
+        self.assertIsNone(toc_options({"toc": False}))
+        self.assertEqual(toc_options({"toc": True}), DEFAULT_OPTIONS)
+        self.assertEqual(toc_options({"toc": {"max_level": 2}})["max_level"], 2)
+
+    def test_github_slug(self):
+        """Test that slugs follow GitHub's anchor rules."""
+        self.assertEqual(github_slug("Getting Started"), "getting-started")
+        self.assertEqual(github_slug("What's `new`? (v2.0)"), "whats-new-v20")
+        self.assertEqual(github_slug("Über uns"), "über-uns")
+        self.assertEqual(github_slug("snake_case - API"), "snake_case---api")
+
+    def test_duplicate_anchors(self):
+        """Test that repeated slugs are numbered in document order."""
+        self.assertEqual(
+            heading_anchors(["Usage", "Usage", "Usage 1", "Usage"]),
+            ["usage", "usage-1", "usage-1-1", "usage-2"],
+        )
+
+    def test_render_toc(self):
+        """Test that entries are nested by level and skip the TOC heading."""
+        headings = [
+            {"title": "Guide", "level": 1},
+            {"title": "Table of Contents", "level": 2},
+            {"title": "Install", "level": 2},
+            {"title": "Options", "level": 3},
+            {"title": "Details", "level": 4},
+        ]
+
+        self.assertEqual(
+            render_toc(headings, DEFAULT_OPTIONS, "\r\n"),
+            "- [Install](#install)\r\n  - [Options](#options)\r\n",
+        )
+
+    def test_find_list(self):
+        """Test that the list of a section is found between prose and blank lines."""
+        data = b"## TOC\nIntro text\n\n- [A](#a)\n  - [B](#b)\n\nMore prose\n"
+        start = data.index(b"Intro")
+
+        found = find_list(data, start, len(data))
+
+        self.assertEqual(data[found[0] : found[1]], b"- [A](#a)\n  - [B](#b)\n")
+
+    def test_find_list_without_list(self):
+        """Test that a section without a list gets an insertion point."""
+        data = b"## TOC\n\n## Next\n"
+        start = data.index(b"\n") + 1
+
+        self.assertEqual(find_list(data, start, data.index(b"## Next")), (8, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
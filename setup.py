@@ -16,12 +16,20 @@ setup(
     url="https://github.com/yourusername/markdown-inspector",
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        "vectorized": ["numpy"],
+    },
     python_requires=">=3.7",
     entry_points={
         "console_scripts": [
             "markdowninspector=markdown_inspector.cli:main",
             "mkinspec=markdown_inspector.cli:main",
         ],
+        "markdown_inspector.rules": [
+            "header_validation=markdown_inspector.features.header_validation"
+            ".core.plugin:HeaderValidationRule",
+            "toc=markdown_inspector.features.toc.core.plugin:TocRule",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -35,4 +43,4 @@ setup(
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
     ],
-)
\ No newline at end of file
+)